@@ -30,6 +30,11 @@ ax.grid(True, alpha=0.3)
 (line,) = ax.plot([], [], "b-", linewidth=2, label="sin(x + t)")
 ax.legend()
 
+# Pré-calcular todos os frames de uma vez (vetorizado)
+N_FRAMES = 100
+X = np.linspace(0, 2 * np.pi, 200)
+Y_FRAMES = np.sin(X[None, :] + np.arange(N_FRAMES)[:, None] / 10)
+
 
 def init():
     """Inicializa a animação"""
@@ -39,14 +44,20 @@ def init():
 
 def update(frame):
     """Atualiza cada frame"""
-    x = np.linspace(0, 2 * np.pi, 200)
-    y = np.sin(x + frame / 10)
-    line.set_data(x, y)
+    line.set_data(X, Y_FRAMES[frame])
     return (line,)
 
 
-# Criar animação
-ani = FuncAnimation(fig, update, init_func=init, frames=100, interval=50, blit=True)
+# Criar animação (cache_frame_data=False evita guardar os dados de cada frame)
+ani = FuncAnimation(
+    fig,
+    update,
+    init_func=init,
+    frames=N_FRAMES,
+    interval=50,
+    blit=True,
+    cache_frame_data=False,
+)
 
 # 3. Salvar vídeo
 print("\nSalvando vídeo...")
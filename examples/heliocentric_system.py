@@ -1,11 +1,11 @@
 """
-Exemplo de uso do módulo ffmpeg_config com animação heliocêntrica
-=================================================================
+Exemplo de uso do pacote ffmpeg_matplotlib com animação heliocêntrica
+====================================================================
 
-Este arquivo demonstra como usar o módulo ffmpeg_config para
+Este arquivo demonstra como usar o pacote ffmpeg_matplotlib para
 simplificar o salvamento de animações Matplotlib.
 
-=================================================================
+====================================================================
 """
 
 import matplotlib.pyplot as plt
@@ -50,17 +50,17 @@ estrelas_y = np.random.uniform(-60, 60, num_estrelas)
 estrelas_tamanhos = np.random.uniform(0.1, 1.5, num_estrelas)
 estrelas_brilho = np.random.uniform(0.3, 1.0, num_estrelas)
 
-# Desenhar as estrelas fixas
-for i in range(num_estrelas):
-    ax.plot(
-        estrelas_x[i],
-        estrelas_y[i],
-        "o",
-        color="white",
-        markersize=estrelas_tamanhos[i],
-        alpha=estrelas_brilho[i],
-        zorder=1,
-    )
+# Desenhar as estrelas fixas (um único artista para todas as estrelas)
+cores_estrelas = np.ones((num_estrelas, 4))
+cores_estrelas[:, 3] = estrelas_brilho  # Brilho individual via canal alfa
+ax.scatter(
+    estrelas_x,
+    estrelas_y,
+    s=estrelas_tamanhos**2,  # scatter usa área (pontos²), plot usa diâmetro
+    c=cores_estrelas,
+    marker="o",
+    zorder=1,
+)
 
 # Dados dos planetas (raio orbital, velocidade, cor, tamanho, nome, epiciclos)
 planetas_dados = [
@@ -226,17 +226,19 @@ orbita_lua = plt.Circle(
 )
 ax.add_patch(orbita_lua)
 
+# Raio do círculo de cada planeta (baseado no tamanho), calculado uma única vez
+RAIO_CIRCULOS = np.sqrt(np.array([p["tamanho"] for p in planetas_dados]) / np.pi) / 7.0
+
 # Criar círculos para cada planeta
 planetas_circulos = []
-for planeta in planetas_dados:
-    # Calcular raio do círculo baseado no tamanho
-    raio = np.sqrt(planeta["tamanho"] / np.pi) / 7
-    circulo = plt.Circle((0, 0), raio, color=planeta["cor"], zorder=50)
+for i, planeta in enumerate(planetas_dados):
+    circulo = plt.Circle((0, 0), RAIO_CIRCULOS[i], color=planeta["cor"], zorder=50)
     ax.add_patch(circulo)
     planetas_circulos.append(circulo)
 
 # Criar círculo para a Lua
 raio_lua = np.sqrt(lua_dados["tamanho"] / np.pi) / 7
+offset_label_lua = raio_lua + 0.5
 circulo_lua = plt.Circle((0, 0), raio_lua, color=lua_dados["cor"], zorder=51)
 ax.add_patch(circulo_lua)
 
@@ -260,6 +262,16 @@ label_lua = ax.text(
     0, 0, "Lua", color="white", fontsize=8, ha="center", va="bottom", zorder=60
 )
 
+# Artistas que se movem a cada frame. Apenas eles são marcados como
+# animados e retornados por init()/update(); órbitas, estrelas e Sol são
+# estáticos e ficam fora da região redesenhada pelo blit.
+elementos_animados = planetas_circulos + labels_planetas
+elementos_animados += [e for e in epiciclos1_circulos if e is not None]
+elementos_animados += [e for e in epiciclos2_circulos if e is not None]
+elementos_animados += [circulo_lua, label_lua, orbita_lua, epiciclo_lua]
+for elemento in elementos_animados:
+    elemento.set_animated(True)
+
 # Fase inicial aleatória para cada planeta e seus epiciclos
 fases_iniciais_deferente = [np.random.uniform(0, 2 * np.pi) for _ in planetas_dados]
 fases_iniciais_epiciclo1 = [np.random.uniform(0, 2 * np.pi) for _ in planetas_dados]
@@ -267,82 +279,69 @@ fases_iniciais_epiciclo2 = [np.random.uniform(0, 2 * np.pi) for _ in planetas_da
 fase_inicial_lua = np.random.uniform(0, 2 * np.pi)
 fase_inicial_lua_epiciclo = np.random.uniform(0, 2 * np.pi)
 
+# Parâmetros orbitais em arrays (um elemento por planeta) para que
+# update() calcule todas as posições em poucas operações vetorizadas
+RAIOS = np.array([p["raio"] for p in planetas_dados], dtype=float)
+VELOCIDADES = np.array([p["velocidade"] for p in planetas_dados])
+EPICICLO1_RAIOS = np.array([p["epiciclo1_raio"] for p in planetas_dados], dtype=float)
+EPICICLO1_VELOCIDADES = np.array([p["epiciclo1_vel"] for p in planetas_dados])
+# Sem primeiro epiciclo o planeta fica sobre o deferente, ignorando o segundo
+EPICICLO2_RAIOS = np.array(
+    [p["epiciclo2_raio"] if p["epiciclo1_raio"] > 0 else 0 for p in planetas_dados],
+    dtype=float,
+)
+EPICICLO2_VELOCIDADES = np.array([p["epiciclo2_vel"] for p in planetas_dados])
+FASES_DEFERENTE = np.array(fases_iniciais_deferente)
+FASES_EPICICLO1 = np.array(fases_iniciais_epiciclo1)
+FASES_EPICICLO2 = np.array(fases_iniciais_epiciclo2)
+INDICE_TERRA = 2
+
+# Deslocamento vertical dos labels (acima de cada planeta)
+OFFSETS_LABELS = RAIO_CIRCULOS + 1
+
 
 def init():
     """Inicializa a animação"""
-    elementos_animados = planetas_circulos + labels_planetas
-    elementos_animados += [e for e in epiciclos1_circulos if e is not None]
-    elementos_animados += [e for e in epiciclos2_circulos if e is not None]
-    elementos_animados += [circulo_lua, label_lua, orbita_lua, epiciclo_lua]
     return elementos_animados
 
 
 def update(frame):
     """Atualiza posições a cada frame"""
 
-    # Posição da Terra (necessária para calcular posição da Lua)
-    x_terra_final = 0
-    y_terra_final = 0
-
-    # Atualizar cada planeta
-    for i, planeta in enumerate(planetas_dados):
-        # Calcular ângulo atual no deferente (órbita principal)
-        angulo_deferente = fases_iniciais_deferente[i] + planeta["velocidade"] * frame
-
-        # Posição do centro do primeiro epiciclo no deferente
-        x_deferente = planeta["raio"] * np.cos(angulo_deferente)
-        y_deferente = planeta["raio"] * np.sin(angulo_deferente)
-
-        # Se o planeta tem epiciclos
-        if planeta["epiciclo1_raio"] > 0:
-            # Atualizar posição do círculo do primeiro epiciclo
-            if epiciclos1_circulos[i] is not None:
-                epiciclos1_circulos[i].set_center((x_deferente, y_deferente))
-
-            # Calcular ângulo no primeiro epiciclo
-            angulo_epiciclo1 = (
-                fases_iniciais_epiciclo1[i] + planeta["epiciclo1_vel"] * frame
-            )
-
-            # Posição do centro do segundo epiciclo no primeiro epiciclo
-            x_epiciclo1 = x_deferente + planeta["epiciclo1_raio"] * np.cos(
-                angulo_epiciclo1
-            )
-            y_epiciclo1 = y_deferente + planeta["epiciclo1_raio"] * np.sin(
-                angulo_epiciclo1
-            )
-
-            # Atualizar posição do círculo do segundo epiciclo
-            if epiciclos2_circulos[i] is not None:
-                epiciclos2_circulos[i].set_center((x_epiciclo1, y_epiciclo1))
-
-            # Calcular ângulo no segundo epiciclo
-            angulo_epiciclo2 = (
-                fases_iniciais_epiciclo2[i] + planeta["epiciclo2_vel"] * frame
-            )
-
-            # Posição final: centro do segundo epiciclo + deslocamento no segundo epiciclo
-            x_epiciclo2 = planeta["epiciclo2_raio"] * np.cos(angulo_epiciclo2)
-            y_epiciclo2 = planeta["epiciclo2_raio"] * np.sin(angulo_epiciclo2)
-
-            x_final = x_epiciclo1 + x_epiciclo2
-            y_final = y_epiciclo1 + y_epiciclo2
-        else:
-            # Terra move-se apenas no deferente (sem epiciclos)
-            x_final = x_deferente
-            y_final = y_deferente
-
-        # Guardar posição da Terra (índice 2)
-        if i == 2:
-            x_terra_final = x_final
-            y_terra_final = y_final
+    # Ângulos de todos os planetas calculados de uma vez (vetorizado)
+    angulos_deferente = FASES_DEFERENTE + VELOCIDADES * frame
+    angulos_epiciclo1 = FASES_EPICICLO1 + EPICICLO1_VELOCIDADES * frame
+    angulos_epiciclo2 = FASES_EPICICLO2 + EPICICLO2_VELOCIDADES * frame
+
+    # Posição do centro do primeiro epiciclo no deferente
+    x_deferente = RAIOS * np.cos(angulos_deferente)
+    y_deferente = RAIOS * np.sin(angulos_deferente)
+
+    # Posição do centro do segundo epiciclo no primeiro epiciclo
+    x_epiciclo1 = x_deferente + EPICICLO1_RAIOS * np.cos(angulos_epiciclo1)
+    y_epiciclo1 = y_deferente + EPICICLO1_RAIOS * np.sin(angulos_epiciclo1)
+
+    # Posição final: centro do segundo epiciclo + deslocamento no segundo epiciclo
+    # (planetas sem epiciclos têm raio zero e ficam sobre o deferente)
+    x_final = x_epiciclo1 + EPICICLO2_RAIOS * np.cos(angulos_epiciclo2)
+    y_final = y_epiciclo1 + EPICICLO2_RAIOS * np.sin(angulos_epiciclo2)
+
+    # Apenas atualização dos artistas permanece no laço Python
+    for i in range(len(planetas_dados)):
+        if epiciclos1_circulos[i] is not None:
+            epiciclos1_circulos[i].set_center((x_deferente[i], y_deferente[i]))
+        if epiciclos2_circulos[i] is not None:
+            epiciclos2_circulos[i].set_center((x_epiciclo1[i], y_epiciclo1[i]))
 
         # Atualizar posição do círculo do planeta
-        planetas_circulos[i].set_center((x_final, y_final))
+        planetas_circulos[i].set_center((x_final[i], y_final[i]))
 
         # Atualizar label do planeta (posicionado acima)
-        raio_circulo = np.sqrt(planeta["tamanho"] / np.pi) / 7
-        labels_planetas[i].set_position((x_final, y_final + raio_circulo + 1))
+        labels_planetas[i].set_position((x_final[i], y_final[i] + OFFSETS_LABELS[i]))
+
+    # Posição da Terra (índice 2, necessária para calcular posição da Lua)
+    x_terra_final = x_final[INDICE_TERRA]
+    y_terra_final = y_final[INDICE_TERRA]
 
     # Atualizar órbita da Lua (centrada na Terra)
     orbita_lua.set_center((x_terra_final, y_terra_final))
@@ -372,12 +371,8 @@ def update(frame):
     circulo_lua.set_center((x_lua, y_lua))
 
     # Atualizar label da Lua
-    label_lua.set_position((x_lua, y_lua + raio_lua + 0.5))
+    label_lua.set_position((x_lua, y_lua + offset_label_lua))
 
-    elementos_animados = planetas_circulos + labels_planetas
-    elementos_animados += [e for e in epiciclos1_circulos if e is not None]
-    elementos_animados += [e for e in epiciclos2_circulos if e is not None]
-    elementos_animados += [circulo_lua, label_lua, orbita_lua, epiciclo_lua]
     return elementos_animados
 
 
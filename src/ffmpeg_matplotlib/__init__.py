@@ -1,7 +1,7 @@
 """Simplified FFmpeg integration for Matplotlib animations"""
 
 from .config import (FFmpegConfig, configurar_ffmpeg, criar_writer,
-                     salvar_animacao)
+                     otimizar_matplotlib_para_animacao, salvar_animacao)
 
 __version__ = "2.1.0"
 
@@ -10,4 +10,5 @@ __all__ = [
     "configurar_ffmpeg",
     "salvar_animacao",
     "criar_writer",
+    "otimizar_matplotlib_para_animacao",
 ]
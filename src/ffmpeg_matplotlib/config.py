@@ -8,21 +8,53 @@ do Matplotlib usando FFmpeg de forma simples e reutilizável.
 ========================================================
 """
 
+import json
 import logging
+import os
 import platform
 import re
 import shutil
 import subprocess
+import sys
 import threading
 import time
-from contextlib import contextmanager
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Dict, Final, List, Optional, Set, Tuple
+from stat import S_ISREG
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Final,
+    FrozenSet,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
+
+# Matplotlib é importado sob demanda: detectar/validar o FFmpeg não precisa dele
+if TYPE_CHECKING:
+    import numpy as np
+    from matplotlib.animation import FFMpegWriter, FuncAnimation
+    from numpy.typing import ArrayLike
 
-import matplotlib.pyplot as plt
-from matplotlib.animation import FFMpegWriter, FuncAnimation
+    from .writer import BufferedFFMpegWriter
+
+# Lock reentrante com menos overhead por aquisição (opcional):
+# pip install "ffmpeg-matplotlib[fast]"
+try:
+    from fastrlock.rlock import FastRLock as _RLock
+except ImportError:
+    _RLock = threading.RLock  # type: ignore[misc,assignment]
 
 # ============================================================================
 # Configuração de Logging
@@ -40,30 +72,139 @@ logger = logging.getLogger(__name__)
 VALIDATION_TIMEOUT: Final[int] = 3
 CODEC_QUERY_TIMEOUT: Final[int] = 5
 
+# close_fds=True percorre todos os descritores do processo antes do exec,
+# custo que cresce com RLIMIT_NOFILE. As consultas rápidas ao FFmpeg
+# (-version, -codecs, -encoders, teste de encoder) usam close_fds=False no
+# POSIX: descritores do Python já nascem não herdáveis (PEP 446), o filho só
+# lê opções e termina, e o pacote não marca descritores como herdáveis.
+_CLOSE_FDS: Final[bool] = sys.platform == "win32"
+
+# Variáveis de ambiente com caminho explícito do FFmpeg (em ordem de prioridade)
+FFMPEG_ENV_VARS: Final[Tuple[str, ...]] = ("FFMPEG_BINARY", "IMAGEIO_FFMPEG_EXE")
+
 # Cache
 CODEC_CACHE_TTL: Final[int] = 3600  # 1 hora em segundos
+DETECT_CACHE_TTL: Final[int] = 300  # 5 minutos em segundos
+DISK_SPACE_CACHE_TTL: Final[float] = 2.0  # segundos
+
+# Cache em disco de codecs (compartilhado entre execuções)
+DISK_CACHE_DIR_NAME: Final[str] = "ffmpeg-matplotlib"
+CODEC_DISK_CACHE_FILE: Final[str] = "codecs.json"
+
+# rcParams que aceleram o desenho de frames no Agg
+ANIMATION_RCPARAMS: Final[Dict[str, Any]] = {
+    "path.simplify": True,
+    "path.simplify_threshold": 1.0,
+    "agg.path.chunksize": 10000,
+}
 
 # Logging
 PROGRESS_LOG_INTERVAL: Final[int] = 10  # Log a cada N frames
 
+# Acima deste número de frames, cache_frame_data=True merece aviso (memória)
+FRAME_CACHE_WARNING_THRESHOLD: Final[int] = 1000
+
+# Frames assumidos quando a animação não informa quantos gera (ex.: gerador)
+DEFAULT_TOTAL_FRAMES: Final[int] = 100
+
+# Abaixo deste número de frames o vídeo é pequeno demais para checar o disco
+MIN_FRAMES_FOR_SPACE_CHECK: Final[int] = 60
+
+# Acima deste volume de frames RGBA por segundo enviado ao FFmpeg, avisar (bytes/s)
+PIPE_THROUGHPUT_WARNING: Final[int] = 200_000_000
+
 # Qualidades válidas
-VALID_QUALITIES: Final[Set[str]] = {"low", "medium", "high", "ultra"}
+VALID_QUALITIES: Final[FrozenSet[str]] = frozenset({"low", "medium", "high", "ultra"})
+# Lista pronta para mensagens de erro
+_VALID_QUALITIES_STR: Final[str] = ", ".join(sorted(VALID_QUALITIES))
 
 # Codecs comuns de fallback
-COMMON_CODECS: Final[Set[str]] = {
-    "libx264",
-    "libx265",
-    "mpeg4",
-    "h264",
-    "vp9",
+COMMON_CODECS: Final[FrozenSet[str]] = frozenset(
+    map(
+        sys.intern,
+        (
+            "libx264",
+            "libx265",
+            "mpeg4",
+            "h264",
+            "vp9",
+            "h264_nvenc",
+            "hevc_nvenc",
+            "libvpx",
+            "libvpx-vp9",
+        ),
+    )
+)
+
+# Extensões de vídeo reconhecidas (demais recebem .mp4)
+VIDEO_EXTENSIONS: Final[FrozenSet[str]] = frozenset(
+    {".mp4", ".m4v", ".mov", ".mkv", ".avi", ".webm", ".gif", ".mpg", ".mpeg"}
+)
+
+# Extensões em que o FFMpegWriter do Matplotlib usa o codec do container
+# (codec = extensão, sem -vcodec): os argumentos do x264 não se aplicam
+CONTAINER_CODEC_EXTENSIONS: Final[FrozenSet[str]] = frozenset(
+    {".apng", ".avif", ".gif", ".webm", ".webp"}
+)
+
+# Codecs que aceitam -preset/-tune/-crf (controle de qualidade por CRF)
+CRF_CODECS: Final[FrozenSet[str]] = frozenset({"libx264", "libx265"})
+
+# Threading do x264: slices paralelos e lookahead sem thread dedicada
+X264_THREAD_PARAMS: Final[str] = "threads=auto:sliced-threads=1:sync-lookahead=0"
+
+# Encoders de hardware em ordem de preferência (codec="auto")
+HW_ENCODER_PRIORITY: Final[Tuple[str, ...]] = (
     "h264_nvenc",
-    "hevc_nvenc",
-    "libvpx",
-    "libvpx-vp9",
+    "h264_videotoolbox",
+    "h264_qsv",
+)
+
+# Encoder de software usado quando nenhum encoder de hardware funciona
+DEFAULT_ENCODER: Final[str] = "libx264"
+
+# Metadados padrão dos vídeos (somente leitura, compartilhado entre writers)
+_DEFAULT_METADATA: Final[Mapping[str, str]] = MappingProxyType(
+    {"artist": "Matplotlib Animation"}
+)
+
+# Argumentos extras específicos de encoders de hardware
+HW_ENCODER_ARGS: Final[Dict[str, List[str]]] = {
+    "h264_nvenc": ["-preset", "p1", "-tune", "ll"],
+    "h264_qsv": ["-preset", "veryfast"],
 }
 
 # Padrão regex para parsing de codecs (suporta hífens)
-CODEC_PATTERN: Final[str] = r"^\s*([D.][E.][VAS][I.][L.][S.])\s+([\w-]+)"
+CODEC_PATTERN: Final[str] = r"^[ \t]*([D.][E.][VAS][I.][L.][S.])[ \t]+([\w-]+)"
+
+# Padrão regex para parsing de encoders ('ffmpeg -encoders')
+ENCODER_PATTERN: Final[str] = r"^[ \t]*([VAS][F.][S.][X.][B.][D.])[ \t]+([\w-]+)"
+
+# Padrões pré-compilados (MULTILINE permite finditer sobre a saída inteira;
+# [ \t] em vez de \s impede que um match atravesse quebras de linha)
+CODEC_RE: Final["re.Pattern[str]"] = re.compile(CODEC_PATTERN, re.MULTILINE)
+ENCODER_RE: Final["re.Pattern[str]"] = re.compile(ENCODER_PATTERN, re.MULTILINE)
+
+# Menor linha de codec possível: 6 flags, espaço e nome
+_MIN_CODEC_LINE_LENGTH: Final[int] = 8
+
+# Linhas de 'ffmpeg -codecs' têm forma fixa: " DEV.LS nome   descrição"
+_CODEC_NAME_OFFSET: Final[int] = 8
+
+# Variável de ambiente que força o parsing de codecs por regex (mais tolerante
+# a formatos inesperados) em vez do scanner de colunas fixas
+CODEC_REGEX_PARSER_ENV: Final[str] = "FFMPEG_MATPLOTLIB_REGEX_PARSER"
+_USE_CODEC_REGEX: Final[bool] = os.environ.get(CODEC_REGEX_PARSER_ENV) == "1"
+
+# Versão do FFmpeg em um único padrão: snapshot git ("N-12345-gabcdef",
+# grupo 1) ou release com prefixo opcional "n" ("4.4.2", "n7.0.2", "7.1")
+_VERSION_RE: Final["re.Pattern[str]"] = re.compile(
+    r"ffmpeg version (?:[Nn]-(\d+)|[Nn]?(\d+)\.(\d+)(?:\.(\d+))?)"
+)
+# Mesmo padrão sobre bytes: a saída do subprocess dispensa decodificação
+_VERSION_BYTES_RE: Final["re.Pattern[bytes]"] = re.compile(
+    _VERSION_RE.pattern.encode("ascii")
+)
 
 
 # ============================================================================
@@ -74,23 +215,29 @@ CODEC_PATTERN: Final[str] = r"^\s*([D.][E.][VAS][I.][L.][S.])\s+([\w-]+)"
 class Quality(Enum):
     """Enum para presets de qualidade."""
 
-    LOW = ("low", 1500, 72)
-    MEDIUM = ("medium", 3000, 100)
-    HIGH = ("high", 5000, 150)
-    ULTRA = ("ultra", 8000, 200)
+    LOW = ("low", 1500, 72, "ultrafast", 28)
+    MEDIUM = ("medium", 3000, 100, "superfast", 23)
+    HIGH = ("high", 5000, 150, "veryfast", 20)
+    ULTRA = ("ultra", 8000, 200, "fast", 18)
 
-    def __init__(self, name: str, bitrate: int, dpi: int):
+    def __init__(self, name: str, bitrate: int, dpi: int, preset: str, crf: int):
         self.quality_name = name
         self.bitrate = bitrate
         self.dpi = dpi
+        self.preset = preset  # Preset do encoder x264/x265
+        self.crf = crf  # Fator de qualidade constante (menor = melhor)
 
     @classmethod
     def from_string(cls, quality: str) -> "Quality":
         """Converte string para enum."""
-        for q in cls:
-            if q.quality_name == quality:
-                return q
-        raise ValueError(f"Qualidade inválida: {quality}")
+        try:
+            return _QUALITY_BY_NAME[quality]
+        except KeyError:
+            raise ValueError(f"Qualidade inválida: {quality}") from None
+
+
+# Lookup O(1) usado por Quality.from_string
+_QUALITY_BY_NAME: Final[Dict[str, Quality]] = {q.quality_name: q for q in Quality}
 
 
 # ============================================================================
@@ -150,22 +297,42 @@ class StrictModeError(FFmpegError):
 # Classes de Dados
 # ============================================================================
 
+# __slots__ (sem __dict__ por instância) onde suportado: Python 3.10+
+_DATACLASS_OPTIONS: Final[Dict[str, Any]] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class CodecQueryResult:
     """Resultado de uma consulta de codecs."""
 
-    codecs: Set[str]
+    codecs: FrozenSet[str]
     using_fallback: bool
-    timestamp: float = field(default_factory=time.time)
+    # Relógio monotônico (time.monotonic), imune a ajustes do relógio do sistema
+    timestamp: float = field(default_factory=time.monotonic)
     error_message: Optional[str] = None
 
-    def is_expired(self, ttl: int = CODEC_CACHE_TTL) -> bool:
-        """Verifica se o cache expirou."""
-        return (time.time() - self.timestamp) > ttl
+    def is_expired(
+        self, ttl: int = CODEC_CACHE_TTL, now: Optional[float] = None
+    ) -> bool:
+        """
+        Verifica se o cache expirou.
+
+        Args:
+            ttl: Validade em segundos
+            now: Instante atual de time.monotonic() (reaproveitado ao
+                verificar vários resultados em sequência)
+
+        Returns:
+            bool: True se o resultado tiver mais de ``ttl`` segundos
+        """
+        if now is None:
+            now = time.monotonic()
+        return (now - self.timestamp) > ttl
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ValidationResult:
     """Resultado de validação de FFmpeg."""
 
@@ -175,32 +342,33 @@ class ValidationResult:
     error_message: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class SaveOptions:
     """Opções para salvar animação."""
 
     fps: int = 20
     dpi: Optional[int] = None
     quality: str = "high"
-    metadata: Optional[Dict[str, str]] = None
+    metadata: Optional[Mapping[str, str]] = None
     verbose: bool = True
     progress_callback: Optional[Callable[[int, int], None]] = None
     codec: str = "libx264"
     bitrate: Optional[int] = None
+    preset: Optional[str] = None
+    crf: Optional[int] = None
     validate_codec: bool = True
     strict_validation: bool = False
     check_disk_space: bool = True
 
-    def __post_init__(self):
+    def __post_init__(self) -> None:
         """Validação após inicialização."""
         if self.quality not in VALID_QUALITIES:
             raise InvalidQualityError(
-                f"Qualidade '{self.quality}' inválida. "
-                f"Use: {', '.join(sorted(VALID_QUALITIES))}"
+                f"Qualidade '{self.quality}' inválida. " f"Use: {_VALID_QUALITIES_STR}"
             )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class DiskSpaceInfo:
     """Informações sobre espaço em disco."""
 
@@ -210,11 +378,160 @@ class DiskSpaceInfo:
     warning_threshold_mb: float = 500.0  # Aviso se sobrar menos que isso
 
 
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
+class _ConfigState:
+    """
+    Estado do FFmpegConfig publicado como um único objeto imutável.
+
+    Escritas substituem o objeto inteiro (sob o lock); leituras fazem uma
+    única leitura de atributo e sempre veem caminho, versão e caches
+    consistentes entre si, sem lock.
+    """
+
+    path: Optional[str] = None
+    version: Optional[Tuple[int, int, int]] = None
+    version_string: str = "Desconhecida"  # Formatada uma vez, junto com version
+    version_pending: bool = False  # Versão ainda não consultada
+    codec_cache: Optional[CodecQueryResult] = None
+    hw_encoder_cache: Optional[Tuple[float, str]] = None
+    # Codecs já confirmados na lista real (não fallback) deste executável
+    validated_codecs: FrozenSet[str] = frozenset()
+
+
 # ============================================================================
 # Detector de FFmpeg
 # ============================================================================
 
 
+# Bits de execução (usuário, grupo, outros) do st_mode
+_EXEC_MODE_BITS: Final[int] = 0o111
+
+# SO atual (não muda durante a execução)
+_SYSTEM: Final[str] = platform.system()
+
+# Extensões tentadas na busca no PATH (PATHEXT no Windows, lido uma vez)
+_PATH_EXTENSIONS: Final[Tuple[str, ...]] = (
+    tuple(
+        ext
+        for ext in os.environ.get("PATHEXT", ".COM;.EXE;.BAT;.CMD").split(os.pathsep)
+        if ext
+    )
+    if sys.platform == "win32"
+    else ("",)
+)
+
+
+def _build_system_paths(system: str) -> Tuple[Path, ...]:
+    """
+    Monta os caminhos de instalação comuns do FFmpeg para um SO.
+
+    Args:
+        system: Nome do SO, como retornado por platform.system()
+
+    Returns:
+        Tuple[Path, ...]: Caminhos possíveis, em ordem de prioridade
+    """
+    home = Path.home()
+
+    if system == "Windows":
+        paths = [
+            Path("C:/ffmpeg/bin/ffmpeg.exe"),
+            Path("C:/Program Files/ffmpeg/bin/ffmpeg.exe"),
+            Path("C:/Program Files (x86)/ffmpeg/bin/ffmpeg.exe"),
+            home / "ffmpeg" / "ffmpeg" / "bin" / "ffmpeg.exe",
+            home / "AppData" / "Local" / "ffmpeg" / "bin" / "ffmpeg.exe",
+        ]
+    elif system == "Darwin":  # macOS
+        paths = [
+            Path("/opt/homebrew/bin/ffmpeg"),  # Apple Silicon
+            Path("/usr/local/bin/ffmpeg"),  # Intel
+            Path("/usr/bin/ffmpeg"),
+            Path("/opt/local/bin/ffmpeg"),  # MacPorts
+        ]
+    else:  # Linux
+        paths = [
+            Path("/usr/bin/ffmpeg"),
+            Path("/usr/local/bin/ffmpeg"),
+            Path("/snap/bin/ffmpeg"),  # Snap
+            Path("/opt/ffmpeg/bin/ffmpeg"),
+            home / "bin" / "ffmpeg",
+            home / ".local" / "bin" / "ffmpeg",
+        ]
+
+    return tuple(paths)
+
+
+# Calculados uma vez na importação: o SO e o home não mudam durante a execução
+_SYSTEM_PATHS: Final[Tuple[Path, ...]] = _build_system_paths(_SYSTEM)
+_SYSTEM_FFMPEG_PATHS: Final[Tuple[str, ...]] = tuple(map(str, _SYSTEM_PATHS))
+
+
+def _is_executable_file(path: str) -> bool:
+    """
+    Verifica se o caminho é um arquivo regular executável com um único stat.
+
+    Substitui ``os.path.isfile`` + ``os.access``: os bits de execução do
+    st_mode bastam para descartar candidatos, e a validação posterior
+    executa o binário de qualquer forma.
+
+    Args:
+        path: Caminho candidato
+
+    Returns:
+        bool: True se existir como arquivo com algum bit de execução
+    """
+    try:
+        mode = os.stat(path).st_mode
+    except (OSError, ValueError):
+        return False
+    return S_ISREG(mode) and bool(mode & _EXEC_MODE_BITS)
+
+
+def _which(name: str, path_env: Optional[str] = None) -> Optional[str]:
+    """
+    Procura um executável no PATH (substitui ``shutil.which``).
+
+    Um único stat por candidato (``_is_executable_file``), sem normalizar
+    nem deduplicar os diretórios do PATH.
+
+    Args:
+        name: Nome do executável; se incluir diretório, só ele é verificado
+        path_env: Valor do PATH (padrão: variável de ambiente atual)
+
+    Returns:
+        Optional[str]: Primeiro candidato executável ou None
+    """
+    if os.path.dirname(name):
+        directories: Tuple[str, ...] = ("",)
+    else:
+        if path_env is None:
+            path_env = os.environ.get("PATH", "")
+        directories = tuple(path_env.split(os.pathsep))
+
+    # Como shutil.which: nome que já termina com extensão do PATHEXT é usado
+    # como está (no POSIX a única "extensão" é "")
+    lowered = name.lower()
+    extensions = _PATH_EXTENSIONS
+    if any(lowered.endswith(ext.lower()) for ext in extensions):
+        extensions = ("",)
+
+    for directory in directories:
+        base = os.path.join(directory, name) if directory else name
+        for ext in extensions:
+            candidate = base + ext
+            if _is_executable_file(candidate):
+                return candidate
+    return None
+
+
+# Busca memorizada por valor de PATH: cada diretório custa um stat (e um por
+# extensão do PATHEXT no Windows)
+@lru_cache(maxsize=8)
+def _find_ffmpeg_in_path(path_env: str) -> Optional[str]:
+    """Procura 'ffmpeg' nos diretórios de ``path_env``."""
+    return _which("ffmpeg", path_env)
+
+
 class FFmpegDetector:
     """
     Classe responsável por detectar FFmpeg no sistema.
@@ -222,40 +539,18 @@ class FFmpegDetector:
     Separação de concerns: apenas detecção de executável.
     """
 
+    # Resultado de auto_detect por (sistema, PATH): (timestamp, caminho)
+    _detect_cache: Dict[Tuple[str, str], Tuple[float, Optional[str]]] = {}
+
     @staticmethod
-    def get_system_specific_paths() -> List[Path]:
+    def get_system_specific_paths() -> Tuple[Path, ...]:
         """
         Retorna caminhos específicos do sistema operacional.
 
         Returns:
-            List[Path]: Lista de caminhos possíveis
-        """
-        system = platform.system()
-
-        if system == "Windows":
-            return [
-                Path("C:/ffmpeg/bin/ffmpeg.exe"),
-                Path("C:/Program Files/ffmpeg/bin/ffmpeg.exe"),
-                Path("C:/Program Files (x86)/ffmpeg/bin/ffmpeg.exe"),
-                Path.home() / "ffmpeg" / "ffmpeg" / "bin" / "ffmpeg.exe",
-                Path.home() / "AppData" / "Local" / "ffmpeg" / "bin" / "ffmpeg.exe",
-            ]
-        elif system == "Darwin":  # macOS
-            return [
-                Path("/opt/homebrew/bin/ffmpeg"),  # Apple Silicon
-                Path("/usr/local/bin/ffmpeg"),  # Intel
-                Path("/usr/bin/ffmpeg"),
-                Path("/opt/local/bin/ffmpeg"),  # MacPorts
-            ]
-        else:  # Linux
-            return [
-                Path("/usr/bin/ffmpeg"),
-                Path("/usr/local/bin/ffmpeg"),
-                Path("/snap/bin/ffmpeg"),  # Snap
-                Path("/opt/ffmpeg/bin/ffmpeg"),
-                Path.home() / "bin" / "ffmpeg",
-                Path.home() / ".local" / "bin" / "ffmpeg",
-            ]
+            Tuple[Path, ...]: Caminhos possíveis (calculados na importação)
+        """
+        return _SYSTEM_PATHS
 
     @staticmethod
     def resolve_path(path: str) -> Optional[str]:
@@ -263,9 +558,9 @@ class FFmpegDetector:
         Resolve caminho de forma consistente.
 
         Tenta múltiplas estratégias:
-        1. shutil.which (se for nome de comando)
-        2. Path absoluto/relativo
-        3. which do nome base (se path incluir diretório)
+        1. Busca no PATH (se for nome de comando)
+        2. Path absoluto (como está) ou relativo/com ~ (resolvido)
+        3. Busca no PATH do nome base (se path incluir diretório)
 
         Args:
             path: Caminho ou nome do executável
@@ -273,20 +568,26 @@ class FFmpegDetector:
         Returns:
             Optional[str]: Caminho resolvido ou None
         """
-        # Estratégia 1: which direto
-        resolved = shutil.which(path)
+        # Estratégia 1: busca no PATH (ou o próprio caminho, se executável)
+        resolved = _which(path)
         if resolved:
             return resolved
 
         # Estratégia 2: path existe como está
-        path_obj = Path(path).expanduser().resolve()
-        if path_obj.exists():
-            return str(path_obj)
+        if os.path.isabs(path):
+            # Absoluto: basta um stat, sem getcwd/readlink do resolve()
+            if os.path.isfile(path):
+                return path
+            base_name = os.path.basename(path)
+        else:
+            path_obj = Path(path).expanduser().resolve()
+            if path_obj.exists():
+                return str(path_obj)
+            base_name = path_obj.name
 
-        # Estratégia 3: tentar which com nome base
+        # Estratégia 3: buscar o nome base no PATH
         if "/" in path or "\\" in path:
-            base_name = path_obj.name
-            resolved = shutil.which(base_name)
+            resolved = _which(base_name)
             if resolved:
                 return resolved
 
@@ -297,10 +598,13 @@ class FFmpegDetector:
         """
         Busca FFmpeg no PATH do sistema.
 
+        O resultado é memorizado para cada valor de PATH até
+        ``invalidate()``.
+
         Returns:
             Optional[str]: Caminho do FFmpeg ou None
         """
-        return cls.resolve_path("ffmpeg")
+        return _find_ffmpeg_in_path(os.environ.get("PATH", ""))
 
     @classmethod
     def auto_detect(cls) -> Optional[str]:
@@ -311,6 +615,36 @@ class FFmpegDetector:
         1. Busca no PATH (mais comum)
         2. Busca em locais específicos do SO
 
+        O resultado é memorizado por DETECT_CACHE_TTL segundos para o mesmo
+        sistema e PATH; mudanças no PATH invalidam o cache automaticamente.
+
+        Returns:
+            Optional[str]: Caminho do FFmpeg detectado ou None
+        """
+        cache_key = (_SYSTEM, os.environ.get("PATH", ""))
+        cached = cls._detect_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < DETECT_CACHE_TTL:
+            return cached[1]
+
+        ffmpeg_path = cls._scan()
+        cls._detect_cache[cache_key] = (time.monotonic(), ffmpeg_path)
+        return ffmpeg_path
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """
+        Descarta os resultados memorizados de auto_detect e find_in_path.
+
+        Útil após instalar/mover o FFmpeg sem alterar o PATH.
+        """
+        cls._detect_cache.clear()
+        _find_ffmpeg_in_path.cache_clear()
+
+    @classmethod
+    def _scan(cls) -> Optional[str]:
+        """
+        Busca o FFmpeg no PATH e em locais específicos do SO, sem cache.
+
         Returns:
             Optional[str]: Caminho do FFmpeg detectado ou None
         """
@@ -321,10 +655,10 @@ class FFmpegDetector:
             return ffmpeg_path
 
         # Prioridade 2: Caminhos específicos do SO
-        for path in cls.get_system_specific_paths():
-            if path.exists():
+        for path in _SYSTEM_FFMPEG_PATHS:
+            if _is_executable_file(path):
                 logger.debug("FFmpeg encontrado em: %s", path)
-                return str(path)
+                return path
 
         logger.debug("FFmpeg não detectado automaticamente")
         return None
@@ -335,6 +669,24 @@ class FFmpegDetector:
 # ============================================================================
 
 
+# Poucos builds distintos do FFmpeg por máquina: cache pequeno basta
+@lru_cache(maxsize=8)
+def _parse_version(version_output: Union[str, bytes]) -> Optional[Tuple[int, int, int]]:
+    """Extrai (major, minor, patch) da saída de 'ffmpeg -version'."""
+    match: Optional["re.Match[Any]"]
+    if isinstance(version_output, bytes):
+        match = _VERSION_BYTES_RE.search(version_output)
+    else:
+        match = _VERSION_RE.search(version_output)
+    if match is None:
+        return None
+
+    git_revision, major, minor, patch = match.groups()
+    if git_revision is not None:
+        return (99, 0, int(git_revision))  # Versão de desenvolvimento
+    return (int(major), int(minor), int(patch or 0))
+
+
 class FFmpegValidator:
     """
     Classe responsável por validar executáveis e codecs FFmpeg.
@@ -343,27 +695,26 @@ class FFmpegValidator:
     """
 
     @staticmethod
-    def parse_version(version_output: str) -> Optional[Tuple[int, int, int]]:
+    def _is_ffmpeg_banner(output: bytes) -> bool:
+        """Verifica se a saída começa com o banner "ffmpeg version"."""
+        # Apenas a primeira linha: evita copiar toda a saída em lower()
+        return b"ffmpeg version" in output.split(b"\n", 1)[0].lower()
+
+    @staticmethod
+    def parse_version(
+        version_output: Union[str, bytes],
+    ) -> Optional[Tuple[int, int, int]]:
         """
         Extrai versão do FFmpeg da saída do comando.
 
         Args:
-            version_output: Saída do comando 'ffmpeg -version'
+            version_output: Saída do comando 'ffmpeg -version' (texto ou
+                bytes brutos do subprocess)
 
         Returns:
             Optional[Tuple[int, int, int]]: (major, minor, patch) ou None
         """
-        # Padrão: "ffmpeg version 4.4.2" ou "ffmpeg version N-12345-gabcdef"
-        match = re.search(r"ffmpeg version (\d+)\.(\d+)\.(\d+)", version_output)
-        if match:
-            return (int(match.group(1)), int(match.group(2)), int(match.group(3)))
-
-        # Versão git/snapshot
-        match = re.search(r"ffmpeg version [Nn]-(\d+)", version_output)
-        if match:
-            return (99, 0, int(match.group(1)))  # Versão de desenvolvimento
-
-        return None
+        return _parse_version(version_output)
 
     @classmethod
     def validate_executable(cls, path: str) -> ValidationResult:
@@ -395,10 +746,11 @@ class FFmpegValidator:
         try:
             result = subprocess.run(
                 [resolved_path, "-version"],
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 timeout=VALIDATION_TIMEOUT,
-                text=True,
                 check=False,
+                close_fds=_CLOSE_FDS,
             )
 
             if result.returncode != 0:
@@ -407,15 +759,14 @@ class FFmpegValidator:
                     error_message=f"Executável retornou erro: {result.returncode}",
                 )
 
-            # Verificar se é realmente FFmpeg
-            if "ffmpeg version" not in result.stdout.lower():
+            # Versão encontrada já prova que é FFmpeg; o banner só é
+            # conferido para builds com versão fora do padrão
+            version = cls.parse_version(result.stdout)
+            if version is None and not cls._is_ffmpeg_banner(result.stdout):
                 return ValidationResult(
                     is_valid=False, error_message="Executável não parece ser FFmpeg"
                 )
 
-            # Extrair versão
-            version = cls.parse_version(result.stdout)
-
             return ValidationResult(is_valid=True, path=resolved_path, version=version)
 
         except subprocess.TimeoutExpired:
@@ -444,77 +795,263 @@ class FFmpegValidator:
         Returns:
             Optional[str]: Nome do codec se for codec de vídeo, None caso contrário
         """
+        # Linhas vazias/curtas não podem conter flags + nome
+        if len(line) < _MIN_CODEC_LINE_LENGTH:
+            return None
+
         # Usar regex robusto (suporta hífens agora)
-        match = re.match(CODEC_PATTERN, line)
+        match = CODEC_RE.match(line)
 
         if not match:
             return None
 
+        return FFmpegValidator._video_codec_name(match)
+
+    @staticmethod
+    def _video_codec_name(match: "re.Match[str]") -> Optional[str]:
+        """
+        Extrai o nome do codec de um match de CODEC_RE.
+
+        Args:
+            match: Match com grupos (flags, nome)
+
+        Returns:
+            Optional[str]: Nome do codec se for codec de vídeo, None caso contrário
+        """
         flags, codec_name = match.groups()
 
-        # Verificar se é codec de vídeo (flag 'V' ou 'v')
-        if "V" in flags.upper():
+        # Verificar se é codec de vídeo (terceira flag: V, A ou S)
+        if flags[2] == "V":
             # Limpar nome do codec
             codec_name = codec_name.strip("()")
 
             if codec_name and not codec_name.startswith("-"):
-                return codec_name
+                # Internado: buscas no conjunto comparam primeiro por identidade
+                return sys.intern(codec_name)
 
         return None
 
     @classmethod
-    def query_available_codecs(cls, ffmpeg_path: str) -> CodecQueryResult:
+    def parse_codecs(cls, codecs_output: str) -> Set[str]:
         """
-        Consulta codecs disponíveis no FFmpeg instalado.
+        Extrai os codecs de vídeo da saída do comando 'ffmpeg -codecs'.
 
         Args:
-            ffmpeg_path: Caminho do executável FFmpeg
+            codecs_output: Saída (stdout) do comando
 
         Returns:
-            CodecQueryResult: Resultado da consulta com codecs e status
+            Set[str]: Nomes dos codecs de vídeo
+        """
+        codecs: Set[str] = set()
+
+        # Seção de codecs começa no separador (ou no cabeçalho "Codecs:")
+        marker = codecs_output.find("-------")
+        if marker == -1:
+            marker = codecs_output.find("Codecs:")
+        if marker == -1:
+            return codecs
+
+        if _USE_CODEC_REGEX:
+            # Uma única varredura regex sobre a saída, a partir do marcador
+            for match in CODEC_RE.finditer(codecs_output, marker):
+                codec_name = cls._video_codec_name(match)
+                if codec_name:
+                    codecs.add(codec_name)
+            return codecs
+
+        # Scanner de colunas fixas: ~4x mais rápido que a regex
+        for line in codecs_output[marker:].split("\n"):
+            codec_name = cls._parse_codec_line_fast(line)
+            if codec_name:
+                codecs.add(codec_name)
+
+        return codecs
+
+    @staticmethod
+    def _parse_codec_line_fast(line: str) -> Optional[str]:
+        """
+        Extrai o codec de vídeo de uma linha de 'ffmpeg -codecs', sem regex.
+
+        Espera a forma exata " DEV.LS nome ..." (espaço, 6 flags, espaço).
+
+        Args:
+            line: Linha não modificada da saída
+
+        Returns:
+            Optional[str]: Nome do codec se for codec de vídeo, None caso contrário
+        """
+        offset = _CODEC_NAME_OFFSET
+        if (
+            len(line) <= offset
+            or line[0] != " "
+            or line[3] != "V"
+            or line[1] not in "D."
+            or line[2] not in "E."
+            or line[offset - 1] != " "
+        ):
+            return None
+
+        end = line.find(" ", offset)
+        codec_name = line[offset:end] if end != -1 else line[offset:]
+        # Legenda (" ..V... = Video codec") e linhas sem nome válido
+        if not codec_name or not (codec_name[0].isalnum() or codec_name[0] == "_"):
+            return None
+
+        return sys.intern(codec_name)
+
+    @classmethod
+    def _codec_result(cls, codecs_output: str) -> CodecQueryResult:
+        """
+        Monta o resultado da consulta a partir da saída de 'ffmpeg -codecs'.
+
+        Args:
+            codecs_output: Saída (stdout) do comando
+
+        Returns:
+            CodecQueryResult: Codecs encontrados ou fallback se nenhum
+        """
+        codecs = cls.parse_codecs(codecs_output)
+
+        # Verificar se encontrou codecs
+        if codecs:
+            logger.debug("Codecs detectados: %d encontrados", len(codecs))
+            return CodecQueryResult(codecs=frozenset(codecs), using_fallback=False)
+
+        logger.warning(
+            "Nenhum codec detectado via parsing. Usando fallback de codecs comuns."
+        )
+        return CodecQueryResult(
+            codecs=COMMON_CODECS,
+            using_fallback=True,
+            error_message="Parsing não encontrou codecs",
+        )
+
+    @classmethod
+    def validate_and_query(cls, path: str) -> Tuple[ValidationResult, CodecQueryResult]:
+        """
+        Valida o executável e consulta os codecs com um único subprocesso.
+
+        'ffmpeg -codecs' escreve o banner com a versão no stderr e a lista
+        de codecs no stdout, então uma execução substitui 'ffmpeg -version'
+        seguido de 'ffmpeg -codecs'. O resultado é gravado no cache em disco.
+
+        Args:
+            path: Caminho para validar
+
+        Returns:
+            Tuple[ValidationResult, CodecQueryResult]: Validação e codecs
+            (codecs de fallback se a validação falhar)
         """
+
+        def invalid(message: str) -> Tuple[ValidationResult, CodecQueryResult]:
+            return (
+                ValidationResult(is_valid=False, error_message=message),
+                CodecQueryResult(
+                    codecs=COMMON_CODECS,
+                    using_fallback=True,
+                    error_message=message,
+                ),
+            )
+
+        # Resolver caminho de forma consistente
+        resolved_path = FFmpegDetector.resolve_path(path)
+        if not resolved_path:
+            return invalid(f"Executável não encontrado: {path}")
+
+        # Cache em disco com versão: nenhum subprocesso
+        entry = _read_cache_entry(resolved_path)
+        if entry is not None and "version" in entry:
+            version = entry["version"]
+            return (
+                ValidationResult(
+                    is_valid=True,
+                    path=resolved_path,
+                    version=tuple(version) if version else None,
+                ),
+                CodecQueryResult(
+                    codecs=frozenset(
+                        sys.intern(str(codec)) for codec in entry["codecs"]
+                    ),
+                    using_fallback=False,
+                    timestamp=_wall_to_monotonic(entry["ts"]),
+                ),
+            )
+
         try:
             result = subprocess.run(
-                [ffmpeg_path, "-codecs"],
+                [resolved_path, "-codecs"],
                 capture_output=True,
                 timeout=CODEC_QUERY_TIMEOUT,
-                text=True,
                 check=False,
+                close_fds=_CLOSE_FDS,
             )
+        except subprocess.TimeoutExpired:
+            return invalid(f"Timeout ao verificar FFmpeg ({CODEC_QUERY_TIMEOUT}s)")
+        except FileNotFoundError:
+            return invalid(f"Executável não encontrado: {resolved_path}")
+        except Exception as e:
+            return invalid(f"Erro ao validar FFmpeg: {e}")
 
-            codecs = set()
-            in_codec_section = False
+        if result.returncode != 0:
+            return invalid(f"Executável retornou erro: {result.returncode}")
 
-            for line in result.stdout.split("\n"):
-                line = line.strip()
+        # Banner vai para o stderr; alguns builds o enviam ao stdout.
+        # Versão encontrada já prova que é FFmpeg.
+        for banner in (result.stderr, result.stdout):
+            version = cls.parse_version(banner)
+            if version is not None or cls._is_ffmpeg_banner(banner):
+                break
+        else:
+            return invalid("Executável não parece ser FFmpeg")
+
+        codec_result = cls._codec_result(_decode_output(result.stdout))
+        if not codec_result.using_fallback:
+            _write_cache_entry(
+                resolved_path,
+                codec_result.codecs,
+                version=list(version) if version else None,
+            )
 
-                # Detectar início da seção de codecs
-                if "-------" in line or "Codecs:" in line:
-                    in_codec_section = True
-                    continue
+        return (
+            ValidationResult(is_valid=True, path=resolved_path, version=version),
+            codec_result,
+        )
 
-                if not in_codec_section or not line:
-                    continue
+    @classmethod
+    def query_available_codecs(cls, ffmpeg_path: str) -> CodecQueryResult:
+        """
+        Consulta codecs disponíveis no FFmpeg instalado.
 
-                # Parse da linha
-                codec_name = cls.parse_codec_line(line)
-                if codec_name:
-                    codecs.add(codec_name)
+        Args:
+            ffmpeg_path: Caminho do executável FFmpeg
 
-            # Verificar se encontrou codecs
-            if codecs:
-                logger.debug("Codecs detectados: %d encontrados", len(codecs))
-                return CodecQueryResult(codecs=codecs, using_fallback=False)
-            else:
-                logger.warning(
-                    "Nenhum codec detectado via parsing. "
-                    "Usando fallback de codecs comuns."
-                )
-                return CodecQueryResult(
-                    codecs=COMMON_CODECS.copy(),
-                    using_fallback=True,
-                    error_message="Parsing não encontrou codecs",
-                )
+        Returns:
+            CodecQueryResult: Resultado da consulta com codecs e status
+        """
+        # Cache em disco: evita o subprocesso em execuções seguintes
+        entry = _read_cache_entry(ffmpeg_path)
+        if entry is not None:
+            logger.debug("Codecs carregados do cache em disco")
+            return CodecQueryResult(
+                codecs=frozenset(sys.intern(str(codec)) for codec in entry["codecs"]),
+                using_fallback=False,
+                timestamp=_wall_to_monotonic(entry["ts"]),
+            )
+
+        try:
+            result = subprocess.run(
+                [ffmpeg_path, "-codecs"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                timeout=CODEC_QUERY_TIMEOUT,
+                check=False,
+                close_fds=_CLOSE_FDS,
+            )
+
+            codec_result = cls._codec_result(_decode_output(result.stdout))
+            if not codec_result.using_fallback:
+                _write_cache_entry(ffmpeg_path, codec_result.codecs)
+            return codec_result
 
         except subprocess.TimeoutExpired:
             logger.warning(
@@ -522,73 +1059,337 @@ class FFmpegValidator:
                 CODEC_QUERY_TIMEOUT,
             )
             return CodecQueryResult(
-                codecs=COMMON_CODECS.copy(),
+                codecs=COMMON_CODECS,
                 using_fallback=True,
                 error_message="Timeout na consulta",
             )
         except Exception as e:
             logger.warning("Erro ao consultar codecs: %s. Usando fallback.", e)
             return CodecQueryResult(
-                codecs=COMMON_CODECS.copy(), using_fallback=True, error_message=str(e)
+                codecs=COMMON_CODECS, using_fallback=True, error_message=str(e)
             )
 
-
-# ============================================================================
-# Utilitários
-# ============================================================================
-
-
-class DiskSpaceValidator:
-    """Validador de espaço em disco."""
-
     @staticmethod
-    def get_available_space(path: Path) -> float:
+    def query_available_encoders(ffmpeg_path: str) -> Set[str]:
         """
-        Retorna espaço disponível em MB.
+        Consulta encoders de vídeo compilados no FFmpeg ('ffmpeg -encoders').
 
         Args:
-            path: Caminho do arquivo ou diretório
+            ffmpeg_path: Caminho do executável FFmpeg
 
         Returns:
-            float: Espaço disponível em MB
+            Set[str]: Nomes dos encoders de vídeo (vazio em caso de erro)
         """
         try:
-            stat = shutil.disk_usage(path.parent if path.is_file() else path)
-            return stat.free / (1024 * 1024)  # Bytes para MB
-        except Exception as e:
-            logger.warning("Erro ao verificar espaço em disco: %s", e)
-            return float("inf")  # Assumir espaço ilimitado em caso de erro
+            result = subprocess.run(
+                [ffmpeg_path, "-hide_banner", "-encoders"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                timeout=CODEC_QUERY_TIMEOUT,
+                check=False,
+                close_fds=_CLOSE_FDS,
+            )
+        except (subprocess.TimeoutExpired, OSError) as e:
+            logger.debug("Erro ao consultar encoders: %s", e)
+            return set()
+
+        # Lista de encoders começa após a linha separadora
+        _, separator, body = _decode_output(result.stdout).partition("------")
+        if not separator:
+            return set()
+
+        return {
+            match.group(2)
+            for match in ENCODER_RE.finditer(body)
+            if match.group(1).startswith("V")
+        }
 
     @staticmethod
-    def estimate_video_size(
-        duration: float,
-        fps: int,
-        quality: Quality,
-        resolution: Optional[Tuple[int, int]] = None,
-    ) -> float:
+    def probe_encoder(ffmpeg_path: str, encoder: str) -> bool:
         """
-        Estima tamanho do vídeo em MB.
+        Verifica se um encoder realmente funciona nesta máquina.
 
-        Fórmula simplificada:
-        tamanho ≈ (bitrate * duration) / 8 / 1024
-
-        Com fator de correção baseado na resolução.
+        Encoders de hardware costumam aparecer em 'ffmpeg -encoders' mesmo
+        sem o dispositivo correspondente, então um frame sintético é
+        codificado para confirmar.
 
         Args:
-            duration: Duração em segundos
-            fps: Frames por segundo
-            quality: Preset de qualidade
-            resolution: (width, height) opcional
+            ffmpeg_path: Caminho do executável FFmpeg
+            encoder: Nome do encoder a testar
 
         Returns:
-            float: Tamanho estimado em MB
+            bool: True se o encoder codificou o frame de teste
         """
-        bitrate_kbps = quality.bitrate
-
-        # Fator de correção para resolução
-        resolution_factor = 1.0
-        if resolution:
-            width, height = resolution
+        try:
+            result = subprocess.run(
+                [
+                    ffmpeg_path,
+                    "-hide_banner",
+                    "-loglevel",
+                    "error",
+                    "-f",
+                    "lavfi",
+                    "-i",
+                    "color=size=256x256:duration=0.1",
+                    "-frames:v",
+                    "1",
+                    "-c:v",
+                    encoder,
+                    "-f",
+                    "null",
+                    "-",
+                ],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=CODEC_QUERY_TIMEOUT,
+                check=False,
+                close_fds=_CLOSE_FDS,
+            )
+            return result.returncode == 0
+        except (subprocess.TimeoutExpired, OSError) as e:
+            logger.debug("Erro ao testar encoder %s: %s", encoder, e)
+            return False
+
+
+# ============================================================================
+# Utilitários
+# ============================================================================
+
+
+def _decode_output(data: bytes) -> str:
+    """
+    Decodifica a saída de uma consulta ao FFmpeg.
+
+    Listagens do FFmpeg são ASCII: decodificar como ASCII é mais rápido que
+    o UTF-8 de ``text=True``; bytes fora da faixa viram U+FFFD.
+
+    Args:
+        data: Saída bruta do subprocesso
+
+    Returns:
+        str: Texto decodificado
+    """
+    return data.decode("ascii", "replace")
+
+
+def _format_version(version: Optional[Tuple[int, int, int]]) -> str:
+    """
+    Formata a versão do FFmpeg para exibição.
+
+    Args:
+        version: (major, minor, patch) ou None
+
+    Returns:
+        str: "major.minor.patch" ou "Desconhecida"
+    """
+    if version:
+        return f"{version[0]}.{version[1]}.{version[2]}"
+    return "Desconhecida"
+
+
+def _wall_to_monotonic(wall_time: float) -> float:
+    """
+    Converte um instante de time.time() para a escala de time.monotonic().
+
+    O cache em disco precisa de relógio de parede (vale entre processos);
+    os TTLs em memória usam o relógio monotônico.
+
+    Args:
+        wall_time: Instante em segundos desde a epoch
+
+    Returns:
+        float: Instante equivalente em time.monotonic()
+    """
+    return time.monotonic() - (time.time() - wall_time)
+
+
+def _disk_cache_path() -> Path:
+    """
+    Retorna o arquivo de cache de codecs do usuário.
+
+    Usa XDG_CACHE_HOME (~/.cache) ou LOCALAPPDATA no Windows.
+
+    Returns:
+        Path: Caminho do arquivo JSON de cache
+    """
+    if _SYSTEM == "Windows":
+        base = os.environ.get("LOCALAPPDATA") or str(Path.home() / "AppData" / "Local")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / DISK_CACHE_DIR_NAME / CODEC_DISK_CACHE_FILE
+
+
+def _load_disk_cache() -> Dict[str, Any]:
+    """
+    Carrega o cache em disco (vazio se ausente ou corrompido).
+
+    Returns:
+        Dict[str, Any]: Entradas por caminho do executável
+    """
+    try:
+        with open(_disk_cache_path(), encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _save_disk_cache(data: Dict[str, Any]) -> None:
+    """
+    Grava o cache em disco de forma atômica (arquivo temporário + os.replace).
+
+    Args:
+        data: Entradas por caminho do executável
+    """
+    path = _disk_cache_path()
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.debug("Não foi possível gravar cache em disco: %s", e)
+
+
+def _read_cache_entry(ffmpeg_path: str) -> Optional[Dict[str, Any]]:
+    """
+    Lê a entrada em cache do executável, se ainda válida.
+
+    A entrada é válida enquanto o executável tiver o mesmo mtime/tamanho
+    e estiver dentro de CODEC_CACHE_TTL.
+
+    Args:
+        ffmpeg_path: Caminho do executável FFmpeg
+
+    Returns:
+        Optional[Dict[str, Any]]: Entrada com "codecs" (e "version", se
+        gravada por validate_and_query) ou None
+    """
+    try:
+        stat = os.stat(ffmpeg_path)
+        entry: Optional[Dict[str, Any]] = _load_disk_cache().get(ffmpeg_path)
+        if entry is None:
+            return None
+        if (
+            entry["mtime"] == stat.st_mtime_ns
+            and entry["size"] == stat.st_size
+            and time.time() - entry["ts"] < CODEC_CACHE_TTL
+            and entry["codecs"]
+        ):
+            return entry
+    except (OSError, KeyError, TypeError, ValueError):
+        pass  # Sem cache ou entrada corrompida: consultar o FFmpeg
+    return None
+
+
+def _write_cache_entry(ffmpeg_path: str, codecs: FrozenSet[str], **extra: Any) -> None:
+    """
+    Grava os codecs consultados (e dados extras) no cache em disco.
+
+    Args:
+        ffmpeg_path: Caminho do executável FFmpeg
+        codecs: Codecs detectados
+        **extra: Campos adicionais da entrada (ex.: version)
+    """
+    try:
+        stat = os.stat(ffmpeg_path)
+    except OSError:
+        return
+
+    data = _load_disk_cache()
+    data[ffmpeg_path] = {
+        "mtime": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "ts": time.time(),
+        "codecs": sorted(codecs),
+        **extra,
+    }
+    _save_disk_cache(data)
+
+
+def _set_matplotlib_ffmpeg_path(path: str) -> None:
+    """Aponta o FFMpegWriter padrão do Matplotlib para o executável."""
+    import matplotlib as mpl
+
+    # O setter de rcParams roda os validadores do Matplotlib: pular se igual
+    if mpl.rcParams["animation.ffmpeg_path"] != path:
+        mpl.rcParams["animation.ffmpeg_path"] = path
+
+
+class DiskSpaceValidator:
+    """Validador de espaço em disco."""
+
+    # Espaço livre por dispositivo (st_dev): (timestamp, MB livres)
+    _space_cache: Dict[int, Tuple[float, float]] = {}
+
+    @classmethod
+    def get_available_space(cls, path: Union[str, Path]) -> float:
+        """
+        Retorna espaço disponível em MB.
+
+        O resultado é reaproveitado por DISK_SPACE_CACHE_TTL segundos para
+        caminhos no mesmo dispositivo.
+
+        Args:
+            path: Caminho do arquivo (existente ou não) ou diretório
+
+        Returns:
+            float: Espaço disponível em MB
+        """
+        try:
+            # Arquivo de saída ainda não existe: usar o diretório
+            directory = path if os.path.isdir(path) else os.path.dirname(path) or "."
+            device = os.stat(directory).st_dev
+
+            now = time.monotonic()
+            cached = cls._space_cache.get(device)
+            if cached is not None and now - cached[0] < DISK_SPACE_CACHE_TTL:
+                return cached[1]
+
+            stat = shutil.disk_usage(directory)
+            available = stat.free / (1024 * 1024)  # Bytes para MB
+            cls._space_cache[device] = (now, available)
+            return available
+        except Exception as e:
+            logger.warning("Erro ao verificar espaço em disco: %s", e)
+            return float("inf")  # Assumir espaço ilimitado em caso de erro
+
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Descarta o espaço livre em cache (ex.: após liberar espaço)."""
+        cls._space_cache.clear()
+
+    @staticmethod
+    def estimate_video_size(
+        duration: float,
+        fps: int,
+        quality: Quality,
+        resolution: Optional[Tuple[int, int]] = None,
+    ) -> float:
+        """
+        Estima tamanho do vídeo em MB.
+
+        Fórmula simplificada:
+        tamanho ≈ (bitrate * duration) / 8 / 1024
+
+        Com fator de correção baseado na resolução.
+
+        Args:
+            duration: Duração em segundos
+            fps: Frames por segundo
+            quality: Preset de qualidade
+            resolution: (width, height) opcional
+
+        Returns:
+            float: Tamanho estimado em MB
+        """
+        bitrate_kbps = quality.bitrate
+
+        # Fator de correção para resolução
+        resolution_factor = 1.0
+        if resolution:
+            width, height = resolution
             pixels = width * height
             # Normalizar para 1920x1080 (Full HD)
             reference_pixels = 1920 * 1080
@@ -602,9 +1403,50 @@ class DiskSpaceValidator:
 
         return size_mb
 
+    @staticmethod
+    def estimate_video_size_batch(
+        durations: "ArrayLike",
+        fps: "ArrayLike",
+        bitrates_kbps: "ArrayLike",
+        resolutions: Optional["ArrayLike"] = None,
+    ) -> "np.ndarray":
+        """
+        Estima o tamanho de vários vídeos de uma vez, em MB.
+
+        Versão vetorizada de ``estimate_video_size`` para muitas
+        combinações de qualidade/resolução (ex.: grade de pré-visualização).
+        Para estimativas avulsas, ``estimate_video_size`` continua mais
+        rápido por não criar arrays.
+
+        Args:
+            durations: Durações em segundos
+            fps: Frames por segundo (não afeta a estimativa, como no escalar)
+            bitrates_kbps: Bitrates em kbps (ex.: ``Quality.HIGH.bitrate``)
+            resolutions: Array (N, 2) de (width, height) opcional
+
+        Returns:
+            np.ndarray: Tamanhos estimados em MB (com broadcasting das entradas)
+        """
+        import numpy as np
+
+        durations = np.asarray(durations, dtype=np.float64)
+        bitrates = np.asarray(bitrates_kbps, dtype=np.float64)
+
+        resolution_factor: Any = 1.0
+        if resolutions is not None:
+            res = np.asarray(resolutions, dtype=np.float64).reshape(-1, 2)
+            resolution_factor = res[:, 0] * res[:, 1] / (1920 * 1080)
+
+        # (kbps * segundos) / 8 / 1024 = MB, com 5% de overhead de container
+        sizes: "np.ndarray" = bitrates * durations * resolution_factor / 8 / 1024 * 1.05
+        return sizes
+
     @classmethod
     def check_space(
-        cls, output_path: Path, estimated_size: float, safety_margin: float = 1.2
+        cls,
+        output_path: Union[str, Path],
+        estimated_size: float,
+        safety_margin: float = 1.2,
     ) -> DiskSpaceInfo:
         """
         Verifica se há espaço suficiente em disco.
@@ -645,6 +1487,17 @@ class FFmpegConfig:
         version (Tuple[int, int, int]): Versão do FFmpeg
     """
 
+    # Sem __dict__ por instância: acesso a atributos por descritor de slot
+    __slots__ = (
+        "_state",
+        "_strict_mode",
+        "_lock",
+        "_warm_up_lock",
+        "_warm_up_thread",
+        "detector",
+        "validator",
+    )
+
     def __init__(
         self,
         ffmpeg_path: Optional[str] = None,
@@ -663,11 +1516,12 @@ class FFmpegConfig:
             detector: Instância customizada do detector (para testes)
             validator: Instância customizada do validator (para testes)
         """
-        self._ffmpeg_path: Optional[str] = None
-        self._ffmpeg_version: Optional[Tuple[int, int, int]] = None
-        self._codec_cache: Optional[CodecQueryResult] = None
+        self._state = _ConfigState()
         self._strict_mode: bool = strict_mode
-        self._lock: threading.RLock = threading.RLock()  # Lock reentrant
+        self._lock = _RLock()  # Lock reentrant
+        # Separado de _lock, que a consulta de fundo segura enquanto executa
+        self._warm_up_lock = threading.Lock()
+        self._warm_up_thread: Optional[threading.Thread] = None
 
         # Dependency injection
         self.detector = detector or FFmpegDetector()
@@ -686,24 +1540,31 @@ class FFmpegConfig:
         Returns:
             bool: True se ffmpeg_path está definido e válido
         """
-        return self._ffmpeg_path is not None
+        return self._state.path is not None
 
     @property
     def ffmpeg_path(self) -> Optional[str]:
         """Retorna o caminho do FFmpeg configurado."""
-        return self._ffmpeg_path
+        return self._state.path
 
     @property
     def version(self) -> Optional[Tuple[int, int, int]]:
-        """Retorna a versão do FFmpeg."""
-        return self._ffmpeg_version
+        """
+        Retorna a versão do FFmpeg.
+
+        Para caminhos auto-detectados a versão é consultada apenas no
+        primeiro acesso (um subprocess 'ffmpeg -version').
+        """
+        if self._state.version_pending:
+            self._probe_version()
+        return self._state.version
 
     @property
     def version_string(self) -> str:
         """Retorna versão como string."""
-        if self._ffmpeg_version:
-            return f"{self._ffmpeg_version[0]}.{self._ffmpeg_version[1]}.{self._ffmpeg_version[2]}"
-        return "Desconhecida"
+        if self._state.version_pending:
+            self._probe_version()
+        return self._state.version_string
 
     @property
     def using_fallback_codecs(self) -> bool:
@@ -713,7 +1574,8 @@ class FFmpegConfig:
         Returns:
             bool: True se usando codecs de fallback
         """
-        return self._codec_cache is not None and self._codec_cache.using_fallback
+        cache = self._state.codec_cache
+        return cache is not None and cache.using_fallback
 
     @property
     def strict_mode(self) -> bool:
@@ -724,9 +1586,24 @@ class FFmpegConfig:
         """
         Detecta automaticamente o FFmpeg no sistema.
 
+        Estratégia:
+        1. Variáveis de ambiente FFMPEG_BINARY / IMAGEIO_FFMPEG_EXE
+        2. Detector (PATH e locais específicos do SO, com cache)
+
         Returns:
             bool: True se FFmpeg foi detectado e configurado com sucesso
         """
+        for env_var in FFMPEG_ENV_VARS:
+            env_path = os.environ.get(env_var)
+            if not env_path:
+                continue
+            try:
+                self.set_ffmpeg_path(env_path)
+                logger.info("✓ FFmpeg configurado via %s: %s", env_var, env_path)
+                return True
+            except FFmpegNotFoundError as e:
+                logger.warning("⚠ %s inválido (%s). Ignorando.", env_var, e)
+
         detected_path = self.detector.auto_detect()
 
         if not detected_path:
@@ -734,44 +1611,136 @@ class FFmpegConfig:
             logger.warning("  Use set_ffmpeg_path() para configurar manualmente.")
             return False
 
+        if detected_path == self._state.path:
+            # Já configurado: manter versão/codecs (e consulta em andamento)
+            return True
+
         try:
-            self.set_ffmpeg_path(detected_path)
+            # O detector só retorna executáveis existentes; a consulta de
+            # versão (subprocess) fica para quando ela for necessária
+            self.set_ffmpeg_path(detected_path, validate=False)
             logger.info("✓ FFmpeg detectado e configurado: %s", detected_path)
-            if self._ffmpeg_version:
-                logger.info("  Versão: %s", self.version_string)
             return True
         except (FFmpegNotFoundError, ValueError) as e:
             logger.error("Erro ao configurar FFmpeg detectado: %s", e)
             return False
 
-    def set_ffmpeg_path(self, path: str) -> None:
+    def set_ffmpeg_path(self, path: str, validate: bool = True) -> None:
         """
         Define o caminho do FFmpeg com validação.
 
         Args:
             path: Caminho para o executável do FFmpeg
+            validate: Se False, aceita o caminho sem executá-lo (usado para
+                caminhos já confirmados pelo detector); a versão é
+                consultada sob demanda
 
         Raises:
             FFmpegNotFoundError: Se o FFmpeg não for encontrado
             ValueError: Se o caminho não for válido
         """
         with self._lock:
-            # Validar antes de configurar
-            validation = self.validator.validate_executable(path)
+            codec_result: Optional[CodecQueryResult] = None
+            if validate:
+                # Validar antes de configurar (a mesma execução lista os codecs)
+                validation, codec_result = self.validator.validate_and_query(path)
+
+                if not validation.is_valid:
+                    raise FFmpegNotFoundError(
+                        validation.error_message or f"FFmpeg inválido: {path}"
+                    )
 
-            if not validation.is_valid:
-                raise FFmpegNotFoundError(
-                    validation.error_message or f"FFmpeg inválido: {path}"
+                # Usar caminho resolvido
+                resolved_path = validation.path or path
+                version = validation.version
+            else:
+                resolved_path = path
+                version = None
+
+            # Novo estado completo: caches do executável anterior descartados
+            if codec_result is not None and codec_result.using_fallback:
+                codec_result = None
+            self._state = _ConfigState(
+                path=resolved_path,
+                version=version,
+                version_string=_format_version(version),
+                version_pending=not validate,
+                codec_cache=codec_result,
+            )
+            _set_matplotlib_ffmpeg_path(resolved_path)
+            logger.debug("FFmpeg configurado: %s", resolved_path)
+
+    def _probe_version(self) -> None:
+        """Consulta a versão do FFmpeg configurado sem validação prévia."""
+        with self._lock:
+            state = self._state
+            if not state.version_pending or state.path is None:
+                return
+
+            validation, codec_result = self.validator.validate_and_query(state.path)
+            if validation.is_valid:
+                codec_cache = state.codec_cache
+                if codec_cache is None and not codec_result.using_fallback:
+                    codec_cache = codec_result
+                self._state = replace(
+                    state,
+                    version=validation.version,
+                    version_string=_format_version(validation.version),
+                    version_pending=False,
+                    codec_cache=codec_cache,
+                )
+            else:
+                self._state = replace(state, version_pending=False)
+                logger.warning(
+                    "Não foi possível obter a versão do FFmpeg: %s",
+                    validation.error_message,
                 )
 
-            # Usar caminho resolvido
-            resolved_path = validation.path or path
+    def warm_up(self) -> Optional[threading.Thread]:
+        """
+        Consulta versão e codecs em uma thread de fundo.
 
-            self._ffmpeg_path = resolved_path
-            self._ffmpeg_version = validation.version
-            self._codec_cache = None  # Limpar cache de codecs
-            plt.rcParams["animation.ffmpeg_path"] = resolved_path
-            logger.debug("FFmpeg configurado: %s", resolved_path)
+        A execução do FFmpeg (``ffmpeg -codecs``) se sobrepõe ao restante
+        do script; quando ``create_writer``/``validate_codec`` forem
+        chamados, o cache já estará pronto (ou aguardam a consulta em
+        andamento pelo lock, sem executar o FFmpeg de novo).
+
+        Inicia no máximo uma thread por vez: enquanto a anterior estiver
+        em execução, ela é retornada em vez de uma nova.
+
+        Returns:
+            Optional[threading.Thread]: Thread em execução, ou None se não
+            houver nada a consultar
+        """
+        state = self._state
+        if state.path is None:
+            return None
+        cache = state.codec_cache
+        if not state.version_pending and cache is not None and not cache.is_expired():
+            return None
+
+        with self._warm_up_lock:
+            thread = self._warm_up_thread
+            if thread is None or not thread.is_alive():
+                thread = threading.Thread(
+                    target=self._warm_up_caches,
+                    name="ffmpeg-matplotlib-warm-up",
+                    daemon=True,
+                )
+                thread.start()
+                self._warm_up_thread = thread
+        return thread
+
+    def _warm_up_caches(self) -> None:
+        """Preenche versão e cache de codecs (executado pela thread de fundo)."""
+        try:
+            if self._state.version_pending:
+                # A mesma execução traz versão e codecs
+                self._probe_version()
+            else:
+                self._get_available_codecs()
+        except FFmpegError as e:
+            logger.debug("Consulta antecipada do FFmpeg falhou: %s", e)
 
     def refresh_codec_cache(self) -> None:
         """
@@ -780,7 +1749,9 @@ class FFmpegConfig:
         Útil quando FFmpeg é atualizado durante execução.
         """
         with self._lock:
-            self._codec_cache = None
+            self._state = replace(
+                self._state, codec_cache=None, validated_codecs=frozenset()
+            )
             if self.configured:
                 self._get_available_codecs()
                 logger.debug("Cache de codecs atualizado")
@@ -801,40 +1772,100 @@ class FFmpegConfig:
                 "FFmpeg não configurado. Configure antes de verificar codecs."
             )
 
-        with self._lock:
-            # Verificar cache válido
-            if self._codec_cache is not None and not self._codec_cache.is_expired():
-                return self._codec_cache
+        # Caminho rápido sem lock: o estado é imutável e publicado por
+        # atribuição atômica, então uma leitura local é consistente
+        cache = self._state.codec_cache
+        if (
+            cache is not None
+            and not cache.is_expired()
+            and not (self._strict_mode and cache.using_fallback)
+        ):
+            return cache
 
-            # Consultar codecs
-            self._codec_cache = self.validator.query_available_codecs(self._ffmpeg_path)
+        with self._lock:
+            # Consultar codecs se o cache estiver vazio ou expirado
+            state = self._state
+            if state.path is None:  # Resetado por outra thread
+                raise FFmpegNotConfiguredError("FFmpeg não configurado.")
+            cache = state.codec_cache
+            queried = cache is None or cache.is_expired()
+            if cache is None or queried:
+                cache = self.validator.query_available_codecs(state.path)
+                # Confirmações valem só para a lista que as gerou
+                self._state = replace(
+                    state, codec_cache=cache, validated_codecs=frozenset()
+                )
 
-            # Verificar modo strict
-            if self._strict_mode and self._codec_cache.using_fallback:
+            # Verificar modo strict (também para fallback já em cache)
+            if self._strict_mode and cache.using_fallback:
                 raise StrictModeError(
                     "Modo strict ativo: não é permitido usar fallback de codecs. "
-                    f"Razão: {self._codec_cache.error_message}"
+                    f"Razão: {cache.error_message}"
                 )
 
             # Alertar se usando fallback
-            if self._codec_cache.using_fallback:
+            if queried and cache.using_fallback:
                 logger.warning(
                     "⚠ Usando lista de fallback de codecs comuns. "
                     "Validação de codec pode não ser confiável."
                 )
-                if self._codec_cache.error_message:
-                    logger.warning("  Razão: %s", self._codec_cache.error_message)
+                if cache.error_message:
+                    logger.warning("  Razão: %s", cache.error_message)
 
-            return self._codec_cache
+            return cache
 
-    def get_available_codecs(self) -> Set[str]:
+    def get_available_codecs(self) -> FrozenSet[str]:
         """
         Retorna conjunto de codecs disponíveis (API pública).
 
         Returns:
-            Set[str]: Conjunto de nomes de codecs
+            FrozenSet[str]: Conjunto imutável de nomes de codecs (compartilhado
+                com o cache; use ``set(...)`` para obter uma cópia editável)
+        """
+        return self._get_available_codecs().codecs
+
+    def _detect_hw_encoder(self) -> str:
+        """
+        Escolhe o melhor encoder H.264 disponível (com cache e TTL).
+
+        Percorre HW_ENCODER_PRIORITY e usa o primeiro encoder de hardware
+        listado pelo FFmpeg que codifique um frame de teste; caso nenhum
+        funcione, usa DEFAULT_ENCODER.
+
+        Returns:
+            str: Nome do encoder escolhido
+
+        Raises:
+            FFmpegNotConfiguredError: Se FFmpeg não estiver configurado
         """
-        return self._get_available_codecs().codecs.copy()
+        if not self.configured:
+            raise FFmpegNotConfiguredError(
+                "FFmpeg não configurado. Configure antes de detectar encoders."
+            )
+
+        with self._lock:
+            state = self._state
+            if state.path is None:  # Resetado por outra thread
+                raise FFmpegNotConfiguredError("FFmpeg não configurado.")
+            if state.hw_encoder_cache is not None:
+                timestamp, encoder = state.hw_encoder_cache
+                if (time.monotonic() - timestamp) <= CODEC_CACHE_TTL:
+                    return encoder
+
+            available = self.validator.query_available_encoders(state.path)
+            encoder = DEFAULT_ENCODER
+            for candidate in HW_ENCODER_PRIORITY:
+                if candidate in available and self.validator.probe_encoder(
+                    state.path, candidate
+                ):
+                    encoder = candidate
+                    break
+
+            logger.debug("Encoder escolhido: %s", encoder)
+            self._state = replace(
+                self._state, hw_encoder_cache=(time.monotonic(), encoder)
+            )
+            return encoder
 
     def validate_codec(self, codec: str, strict: bool = True) -> bool:
         """
@@ -850,12 +1881,23 @@ class FFmpegConfig:
         Raises:
             InvalidCodecError: Se codec não disponível (apenas se strict=True)
         """
+        # Codec já confirmado para este executável: nada a consultar enquanto
+        # a lista de codecs que o confirmou não expirar
+        state = self._state
+        cache = state.codec_cache
+        if (
+            codec in state.validated_codecs
+            and cache is not None
+            and not cache.is_expired()
+        ):
+            return True
+
         codec_result = self._get_available_codecs()
         available_codecs = codec_result.codecs
 
         if codec not in available_codecs:
-            # Mostrar exemplos de codecs disponíveis
-            examples = ", ".join(sorted(list(available_codecs)[:10]))
+            # Mostrar os 10 primeiros codecs disponíveis, em ordem alfabética
+            examples = ", ".join(sorted(available_codecs)[:10])
 
             error_msg = (
                 f"Codec '{codec}' não está disponível. "
@@ -875,6 +1917,15 @@ class FFmpegConfig:
                 logger.debug(error_msg)
                 return False
 
+        # Fallback não confirma o codec: continuar consultando até a lista real
+        if not codec_result.using_fallback:
+            with self._lock:
+                state = self._state
+                if state.codec_cache is codec_result:
+                    self._state = replace(
+                        state, validated_codecs=state.validated_codecs | {codec}
+                    )
+
         return True
 
     def create_writer(
@@ -883,21 +1934,33 @@ class FFmpegConfig:
         bitrate: Optional[int] = None,
         codec: str = "libx264",
         quality: str = "high",
-        metadata: Optional[Dict[str, str]] = None,
+        metadata: Optional[Mapping[str, str]] = None,
         validate_codec: bool = True,
         strict_validation: bool = False,
-    ) -> FFMpegWriter:
+        preset: Optional[str] = None,
+        crf: Optional[int] = None,
+    ) -> "FFMpegWriter":
         """
         Cria um writer FFmpeg configurado.
 
+        O writer retornado é um BufferedFFMpegWriter, que amplia o buffer
+        do pipe usado para enviar os frames ao FFmpeg.
+
+        Para codecs x264/x265 sem bitrate explícito, a qualidade é
+        controlada por CRF com o preset rápido da qualidade escolhida e
+        ``-tune zerolatency``, o que reduz bastante o tempo de encoding.
+
         Args:
             fps: Frames por segundo (padrão: 20)
             bitrate: Taxa de bits em kbps (padrão: automático por qualidade)
-            codec: Codec de vídeo (padrão: 'libx264')
+            codec: Codec de vídeo (padrão: 'libx264'); 'auto' prefere
+                encoder de hardware (NVENC, VideoToolbox, QSV) se disponível
             quality: Preset de qualidade - 'low', 'medium', 'high', 'ultra'
             metadata: Metadados do vídeo
             validate_codec: Se True, valida se codec está disponível
             strict_validation: Se True, lança exceção se codec inválido
+            preset: Preset do encoder x264/x265 (padrão: automático por qualidade)
+            crf: Fator de qualidade constante (padrão: automático por qualidade)
 
         Returns:
             FFMpegWriter: Writer configurado
@@ -918,22 +1981,56 @@ class FFmpegConfig:
             quality_enum = Quality.from_string(quality)
         except ValueError:
             raise InvalidQualityError(
-                f"Qualidade '{quality}' inválida. "
-                f"Use: {', '.join(sorted(VALID_QUALITIES))}"
+                f"Qualidade '{quality}' inválida. " f"Use: {_VALID_QUALITIES_STR}"
             )
 
-        # Validar codec se solicitado
-        if validate_codec:
+        if codec == "auto":
+            # Encoder já confirmado pelo frame de teste
+            codec = self._detect_hw_encoder()
+        elif validate_codec:
+            # Validar codec se solicitado
             self.validate_codec(codec, strict=strict_validation)
 
-        # Usar bitrate do preset se não especificado
-        if bitrate is None:
-            bitrate = quality_enum.bitrate
+        extra_args: List[str] = []
+        if codec in CRF_CODECS:
+            extra_args += ["-preset", preset or quality_enum.preset]
+            extra_args += ["-tune", "zerolatency"]
+            if bitrate is None:
+                # CRF controla a qualidade; bitrate <= 0 omite o '-b'
+                extra_args += [
+                    "-crf",
+                    str(crf if crf is not None else quality_enum.crf),
+                ]
+                bitrate = -1
+            # Encoding multi-thread (0 = automático pelo número de núcleos)
+            extra_args += ["-threads", "0"]
+            if codec == "libx264":
+                extra_args += ["-x264-params", X264_THREAD_PARAMS]
+            # yuv420p exige dimensões pares
+            extra_args += ["-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2"]
+            extra_args += ["-pix_fmt", "yuv420p"]
+        else:
+            if codec in HW_ENCODER_ARGS:
+                extra_args += HW_ENCODER_ARGS[codec]
+            if codec in HW_ENCODER_PRIORITY:
+                extra_args += ["-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2"]
+                extra_args += ["-pix_fmt", "yuv420p"]
+            if bitrate is None:
+                # Usar bitrate do preset se não especificado
+                bitrate = quality_enum.bitrate
 
         if metadata is None:
-            metadata = {"artist": "Matplotlib Animation"}
+            metadata = _DEFAULT_METADATA
 
-        return FFMpegWriter(fps=fps, metadata=metadata, bitrate=bitrate, codec=codec)
+        from .writer import BufferedFFMpegWriter
+
+        return BufferedFFMpegWriter(
+            fps=fps,
+            metadata=cast(Dict[str, str], metadata),  # Só lido pelo writer
+            bitrate=bitrate,
+            codec=codec,
+            extra_args=extra_args,
+        )
 
     def _create_verbose_callback(
         self, user_callback: Optional[Callable[[int, int], None]] = None
@@ -949,10 +2046,23 @@ class FFmpegConfig:
         Returns:
             Callable: Callback combinado
         """
+        # Logging desativado: nada a fazer por frame além do callback do usuário
+        if not logger.isEnabledFor(logging.INFO):
+            if user_callback is not None:
+                return user_callback
+
+            def ignore_progress(current_frame: int, total_frames: int) -> None:
+                pass
+
+            return ignore_progress
+
+        # Próximo frame a registrar (lista: mutável dentro do closure)
+        next_log = [0]
 
         def combined_callback(current_frame: int, total_frames: int) -> None:
-            # Logging a cada N frames
-            if current_frame % PROGRESS_LOG_INTERVAL == 0:
+            # Logging a cada N frames: apenas uma comparação nos demais frames
+            if current_frame >= next_log[0]:
+                next_log[0] = current_frame + PROGRESS_LOG_INTERVAL
                 progress = (current_frame / total_frames) * 100
                 logger.info(
                     "  Progresso: %.1f%% (%d/%d)", progress, current_frame, total_frames
@@ -964,12 +2074,91 @@ class FFmpegConfig:
 
         return combined_callback
 
+    @staticmethod
+    def _verbose(options: SaveOptions) -> bool:
+        """
+        Indica se os logs verbose devem ser produzidos.
+
+        Com INFO desativado no logger, os blocos verbose (formatação,
+        caminhos, tamanhos) são pulados por inteiro.
+
+        Args:
+            options: Opções de salvamento
+
+        Returns:
+            bool: True se verbose estiver ativo e o nível INFO habilitado
+        """
+        return options.verbose and logger.isEnabledFor(logging.INFO)
+
+    @staticmethod
+    def _warn_pipe_throughput(resolution: Tuple[int, int], fps: int) -> None:
+        """
+        Avisa quando o volume de frames RGBA enviado ao FFmpeg é muito alto.
+
+        Args:
+            resolution: Resolução dos frames (largura, altura) em pixels
+            fps: Frames por segundo do vídeo
+        """
+        width, height = resolution
+        bytes_per_second = width * height * 4 * fps
+        if bytes_per_second > PIPE_THROUGHPUT_WARNING:
+            logger.warning(
+                "⚠ %dx%d a %d fps envia %.1f MB/s ao FFmpeg. "
+                "Considere reduzir o DPI ou a qualidade.",
+                width,
+                height,
+                fps,
+                bytes_per_second / (1024 * 1024),
+            )
+
+    @staticmethod
+    def _count_frames(animation: "FuncAnimation") -> int:
+        """
+        Número de frames que a animação vai gerar ao ser salva.
+
+        Args:
+            animation: Animação a salvar
+
+        Returns:
+            int: Frames informados pela animação ou DEFAULT_TOTAL_FRAMES
+        """
+        # FuncAnimation: save_count (ou len(frames)); ArtistAnimation: artistas
+        save_count = getattr(animation, "_save_count", None)
+        if save_count is None:
+            framedata = getattr(animation, "_framedata", None)
+            if isinstance(framedata, list):
+                save_count = len(framedata)
+        return save_count or DEFAULT_TOTAL_FRAMES
+
+    @staticmethod
+    def _warn_frame_cache(animation: "FuncAnimation") -> None:
+        """
+        Avisa quando a animação guarda em memória os dados de muitos frames.
+
+        Com ``cache_frame_data=True`` o FuncAnimation mantém o valor de cada
+        frame gerado até ``save_count``, o que cresce com o número de frames
+        durante o ``save``.
+
+        Args:
+            animation: Objeto FuncAnimation do Matplotlib
+        """
+        if not getattr(animation, "_cache_frame_data", False):
+            return
+
+        save_count = getattr(animation, "_save_count", None)
+        if save_count is not None and save_count >= FRAME_CACHE_WARNING_THRESHOLD:
+            logger.warning(
+                "⚠ Animação com cache_frame_data=True e %d frames: os dados de "
+                "cada frame ficam em memória. Use cache_frame_data=False.",
+                save_count,
+            )
+
     def save_animation(
         self,
-        animation: FuncAnimation,
+        animation: "FuncAnimation",
         filename: str,
         options: Optional[SaveOptions] = None,
-        **kwargs,
+        **kwargs: Any,
     ) -> str:
         """
         Salva uma animação em arquivo de vídeo.
@@ -995,6 +2184,248 @@ class FFmpegConfig:
         if options is None:
             options = SaveOptions(**kwargs)
 
+        self._warn_frame_cache(animation)
+
+        # Estimar tamanho (assumir duração baseada em frames)
+        total_frames = self._count_frames(animation)
+
+        file_path, dpi, writer = self._prepare_save(
+            filename, options, getattr(animation, "_fig", None), total_frames
+        )
+        self._run_save(animation, file_path, dpi, writer, options)
+
+        return self._report_saved(file_path, options, writer)
+
+    def save_animations_batch(
+        self,
+        jobs: Sequence[Tuple["FuncAnimation", str]],
+        options: Optional[SaveOptions] = None,
+        **kwargs: Any,
+    ) -> List[str]:
+        """
+        Salva várias animações com as mesmas opções.
+
+        Qualidade, codec e writer são resolvidos uma única vez: o mesmo
+        writer é reaproveitado em todos os salvamentos com o mesmo tipo de
+        container (``setup`` inicia um novo processo FFmpeg a cada animação).
+
+        Args:
+            jobs: Pares (animação, nome do arquivo de saída)
+            options: SaveOptions ou None (usa kwargs se None)
+            **kwargs: Argumentos alternativos (apenas se options=None)
+
+        Returns:
+            List[str]: Caminhos completos dos arquivos salvos, na ordem de jobs
+
+        Raises:
+            FFmpegNotConfiguredError: Se FFmpeg não estiver configurado
+            InvalidQualityError: Se qualidade for inválida
+            InsufficientDiskSpaceError: Se não houver espaço em disco
+        """
+        if not self.configured:
+            raise FFmpegNotConfiguredError("FFmpeg não configurado.")
+
+        if options is None:
+            options = SaveOptions(**kwargs)
+
+        saved: List[str] = []
+        # Um writer por codec de container (.webm, .gif...); None = options.codec
+        writers: Dict[Optional[str], "BufferedFFMpegWriter"] = {}
+        for animation, filename in jobs:
+            self._warn_frame_cache(animation)
+            total_frames = self._count_frames(animation)
+
+            file_path = self._output_path(filename)
+            container_codec = _container_codec(file_path)
+            file_path, dpi, writer = self._prepare_save(
+                file_path,
+                options,
+                getattr(animation, "_fig", None),
+                total_frames,
+                writer=writers.get(container_codec),
+            )
+            writers[container_codec] = writer
+            self._run_save(animation, file_path, dpi, writer, options)
+            saved.append(self._report_saved(file_path, options, writer))
+
+        return saved
+
+    def _run_save(
+        self,
+        animation: "FuncAnimation",
+        file_path: str,
+        dpi: int,
+        writer: "BufferedFFMpegWriter",
+        options: SaveOptions,
+    ) -> None:
+        """
+        Executa ``animation.save`` com o writer preparado.
+
+        Args:
+            animation: Animação a salvar
+            file_path: Caminho do arquivo de saída
+            dpi: Resolução dos frames
+            writer: Writer configurado
+            options: Opções de salvamento
+        """
+        # Configurar callback de progresso
+        callback = (
+            self._create_verbose_callback(options.progress_callback)
+            if options.progress_callback is not None or self._verbose(options)
+            else None
+        )
+
+        # Preparar argumentos para save
+        save_kwargs: Dict[str, Any] = {
+            "writer": writer,
+            "dpi": dpi,
+            "progress_callback": callback,
+        }
+
+        # Salvar animação
+        try:
+            animation.save(file_path, **save_kwargs)
+        except TypeError as e:
+            # Fallback para versões antigas sem progress_callback
+            if "progress_callback" in str(e):
+                logger.warning(
+                    "Versão do Matplotlib não suporta progress_callback, "
+                    "salvando sem callback..."
+                )
+                save_kwargs.pop("progress_callback", None)
+                animation.save(file_path, **save_kwargs)
+            else:
+                raise
+        except Exception as e:
+            logger.error("Erro ao salvar animação: %s", e)
+            raise
+
+    def save_animation_parallel(
+        self,
+        fig_factory: Callable[[], Any],
+        update_fn: Callable[[Any, int], Any],
+        num_frames: int,
+        filename: str,
+        workers: Optional[int] = None,
+        options: Optional[SaveOptions] = None,
+        **kwargs: Any,
+    ) -> str:
+        """
+        Salva uma animação renderizando os frames em paralelo.
+
+        Cada processo worker cria sua própria figura com ``fig_factory()`` e,
+        para cada frame, chama ``update_fn(fig, frame)`` e renderiza com Agg.
+        O processo principal recebe os frames em ordem e os envia ao FFmpeg.
+
+        Requer animação determinística: o frame ``i`` deve depender apenas
+        de ``i``, não de estado acumulado de frames anteriores.
+        ``fig_factory`` e ``update_fn`` precisam ser picláveis (funções
+        definidas no nível de módulo).
+
+        Args:
+            fig_factory: Função sem argumentos que cria a figura
+            update_fn: Função (figura, índice do frame) que atualiza a figura
+            num_frames: Número total de frames
+            filename: Nome do arquivo de saída
+            workers: Número de processos (None = núcleos - 1, um fica para o FFmpeg)
+            options: SaveOptions ou None (usa kwargs se None)
+            **kwargs: Argumentos alternativos (apenas se options=None)
+
+        Returns:
+            str: Caminho completo do arquivo salvo
+
+        Raises:
+            FFmpegNotConfiguredError: Se FFmpeg não estiver configurado
+            InvalidQualityError: Se qualidade for inválida
+            InsufficientDiskSpaceError: Se não houver espaço em disco
+            ValueError: Se num_frames ou workers forem inválidos
+        """
+        if not self.configured:
+            raise FFmpegNotConfiguredError("FFmpeg não configurado.")
+
+        if num_frames < 1:
+            raise ValueError(f"num_frames deve ser positivo: {num_frames}")
+
+        if workers is None:
+            workers = max(1, (os.cpu_count() or 2) - 1)
+        elif workers < 1:
+            raise ValueError(f"workers deve ser positivo: {workers}")
+
+        import matplotlib.pyplot as plt
+
+        from .writer import render_frames_parallel
+
+        # Criar SaveOptions se não fornecido
+        if options is None:
+            options = SaveOptions(**kwargs)
+
+        # Figura local: define o tamanho dos frames esperado pelo FFmpeg
+        fig = fig_factory()
+        try:
+            file_path, dpi, writer = self._prepare_save(
+                filename, options, fig, num_frames
+            )
+
+            callback = None
+            if options.progress_callback is not None or self._verbose(options):
+                callback = self._create_verbose_callback(options.progress_callback)
+
+            if self._verbose(options):
+                logger.info("  Renderizando com %d processos", workers)
+
+            try:
+                with writer.saving(fig, file_path, dpi):
+                    frames = render_frames_parallel(
+                        fig_factory, update_fn, num_frames, dpi, workers
+                    )
+                    for frame_number, frame in enumerate(frames):
+                        writer.grab_frame_raw(frame)
+                        if callback is not None:
+                            callback(frame_number, num_frames)
+            except Exception as e:
+                logger.error("Erro ao salvar animação: %s", e)
+                raise
+        finally:
+            plt.close(fig)
+
+        return self._report_saved(file_path, options, writer)
+
+    @staticmethod
+    def _output_path(filename: str) -> str:
+        """Normaliza o nome do arquivo de saída (extensão desconhecida: .mp4)."""
+        # os.path: sem objetos Path
+        file_path = os.fspath(filename)
+        if os.path.splitext(file_path)[1].lower() not in VIDEO_EXTENSIONS:
+            file_path += ".mp4"
+            logger.debug("Extensão .mp4 adicionada automaticamente")
+        return file_path
+
+    def _prepare_save(
+        self,
+        filename: str,
+        options: SaveOptions,
+        fig: Optional[Any],
+        total_frames: int,
+        writer: Optional["BufferedFFMpegWriter"] = None,
+    ) -> Tuple[str, int, "BufferedFFMpegWriter"]:
+        """
+        Prepara o salvamento: arquivo de saída, DPI, espaço em disco e writer.
+
+        Args:
+            filename: Nome do arquivo de saída
+            options: Opções de salvamento
+            fig: Figura da animação (None se indisponível)
+            total_frames: Número estimado de frames
+            writer: Writer já criado com as mesmas opções e o mesmo codec de
+                container (reaproveitado)
+
+        Returns:
+            Tuple[str, int, BufferedFFMpegWriter]: Caminho, DPI e writer
+
+        Raises:
+            InvalidQualityError: Se qualidade for inválida
+            InsufficientDiskSpaceError: Se não houver espaço em disco
+        """
         # Usar enum para qualidade
         quality_enum = Quality.from_string(options.quality)
 
@@ -1002,34 +2433,31 @@ class FFmpegConfig:
         dpi = options.dpi if options.dpi is not None else quality_enum.dpi
         logger.debug("DPI: %d (qualidade: %s)", dpi, options.quality)
 
-        # Validar e normalizar nome do arquivo
-        file_path = Path(filename)
-        if file_path.suffix == "":
-            file_path = file_path.with_suffix(".mp4")
-            logger.debug("Extensão .mp4 adicionada automaticamente")
+        file_path = self._output_path(filename)
 
         # Criar diretório se necessário
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Verificar espaço em disco
-        if options.check_disk_space:
-            # Estimar tamanho (assumir duração baseada em frames)
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Resolução dos frames enviados ao FFmpeg
+        resolution = None
+        if fig is not None:
+            resolution = (
+                int(fig.get_figwidth() * dpi),
+                int(fig.get_figheight() * dpi),
+            )
+            self._warn_pipe_throughput(resolution, options.fps)
+
+        # Verificar espaço em disco (vídeos curtos não justificam o statvfs)
+        if (
+            options.check_disk_space
+            and options.fps
+            and total_frames >= MIN_FRAMES_FOR_SPACE_CHECK
+        ):
             try:
-                total_frames = (
-                    len(animation._func_handles)
-                    if hasattr(animation, "_func_handles")
-                    else 100
-                )
                 duration = total_frames / options.fps
 
-                fig = animation._fig if hasattr(animation, "_fig") else None
-                resolution = None
-                if fig:
-                    resolution = (
-                        int(fig.get_figwidth() * dpi),
-                        int(fig.get_figheight() * dpi),
-                    )
-
                 estimated_size = DiskSpaceValidator.estimate_video_size(
                     duration, options.fps, quality_enum, resolution
                 )
@@ -1055,80 +2483,92 @@ class FFmpegConfig:
             except Exception as e:
                 logger.debug("Não foi possível verificar espaço em disco: %s", e)
 
-        # Criar writer
-        writer = self.create_writer(
-            fps=options.fps,
-            bitrate=options.bitrate,
-            codec=options.codec,
-            quality=options.quality,
-            metadata=options.metadata,
-            validate_codec=options.validate_codec,
-            strict_validation=options.strict_validation,
-        )
+        # Criar writer (salvamentos em lote reaproveitam o mesmo). Em .webm,
+        # .gif etc. o Matplotlib troca o codec pelo do container: criar o
+        # writer já com ele, sem os argumentos do x264
+        container_codec = _container_codec(file_path)
+        if writer is None:
+            writer = cast(
+                "BufferedFFMpegWriter",
+                self.create_writer(
+                    fps=options.fps,
+                    bitrate=options.bitrate,
+                    codec=container_codec or options.codec,
+                    quality=options.quality,
+                    metadata=options.metadata,
+                    validate_codec=options.validate_codec and not container_codec,
+                    strict_validation=options.strict_validation,
+                    preset=options.preset,
+                    crf=options.crf,
+                ),
+            )
 
         # Log inicial se verbose
-        if options.verbose:
+        if self._verbose(options):
             logger.info("\n" + "=" * 60)
-            logger.info("Salvando animação: %s", file_path.name)
+            logger.info("Salvando animação: %s", os.path.basename(file_path))
             logger.info("=" * 60)
             logger.info("Configurações:")
             logger.info("  • FPS: %d", options.fps)
             logger.info("  • DPI: %d", dpi)
             logger.info("  • Qualidade: %s", options.quality)
             logger.info("  • Codec: %s", writer.codec)
-            logger.info("  • Bitrate: %d kbps", writer.bitrate)
-            if self._ffmpeg_version:
+            if writer.bitrate > 0:
+                logger.info("  • Bitrate: %d kbps", writer.bitrate)
+            elif writer.codec in CRF_CODECS:
+                crf = options.crf if options.crf is not None else quality_enum.crf
+                preset = options.preset or quality_enum.preset
+                logger.info("  • CRF: %d (preset: %s)", crf, preset)
+            if self.version:
                 logger.info("  • FFmpeg: %s", self.version_string)
             logger.info("=" * 60)
             logger.info("Processando frames...")
 
-        # Preparar argumentos para save
-        save_kwargs: Dict[str, Any] = {"writer": writer, "dpi": dpi}
+        return file_path, dpi, writer
 
-        # Configurar callback de progresso
-        if options.verbose or options.progress_callback is not None:
-            callback = self._create_verbose_callback(options.progress_callback)
-            save_kwargs["progress_callback"] = callback
+    @staticmethod
+    def _report_saved(
+        file_path: str, options: SaveOptions, writer: "BufferedFFMpegWriter"
+    ) -> str:
+        """
+        Confere o arquivo gerado e registra o resumo do salvamento.
 
-        # Salvar animação
-        try:
-            animation.save(str(file_path), **save_kwargs)
-        except TypeError as e:
-            # Fallback para versões antigas sem progress_callback
-            if "progress_callback" in str(e):
-                logger.warning(
-                    "Versão do Matplotlib não suporta progress_callback, "
-                    "salvando sem callback..."
-                )
-                save_kwargs.pop("progress_callback", None)
-                animation.save(str(file_path), **save_kwargs)
-            else:
-                raise
-        except Exception as e:
-            logger.error("Erro ao salvar animação: %s", e)
-            raise
+        Args:
+            file_path: Caminho do arquivo de saída
+            options: Opções de salvamento
+            writer: Writer usado no salvamento
 
-        # Verificar resultado
-        if not file_path.exists():
-            raise RuntimeError(f"Arquivo não foi criado: {file_path}")
+        Returns:
+            str: Caminho completo do arquivo salvo
 
-        file_size = file_path.stat().st_size / (1024 * 1024)  # MB
+        Raises:
+            RuntimeError: Se o arquivo não foi criado
+        """
+        # Verificar resultado (um único stat)
+        try:
+            file_size = os.stat(file_path).st_size / (1024 * 1024)  # MB
+        except FileNotFoundError:
+            raise RuntimeError(f"Arquivo não foi criado: {file_path}") from None
 
-        if options.verbose:
+        absolute_path = os.path.abspath(file_path)
+        if FFmpegConfig._verbose(options):
             logger.info("=" * 60)
             logger.info("✓ Vídeo salvo com sucesso!")
             logger.info("=" * 60)
-            logger.info("Arquivo: %s", file_path.name)
-            logger.info("Caminho completo: %s", file_path.absolute())
+            logger.info("Arquivo: %s", os.path.basename(file_path))
+            logger.info("Caminho completo: %s", absolute_path)
             logger.info("Tamanho: %.2f MB", file_size)
+            logger.info(
+                "Dados enviados ao FFmpeg: %.1f MB",
+                getattr(writer, "bytes_sent", 0) / (1024 * 1024),
+            )
             logger.info("=" * 60 + "\n")
 
-        return str(file_path.absolute())
+        return absolute_path
 
-    @contextmanager
     def temporary_config(
         self, ffmpeg_path: Optional[str] = None, strict_mode: Optional[bool] = None
-    ):
+    ) -> "_TempConfig":
         """
         Context manager para configurações temporárias (thread-safe).
 
@@ -1140,27 +2580,62 @@ class FFmpegConfig:
             >>> with config.temporary_config(ffmpeg_path='/tmp/ffmpeg'):
             ...     config.save_animation(ani, 'video.mp4')
         """
-        with self._lock:
-            # Guardar estado atual
-            old_path = self._ffmpeg_path
-            old_version = self._ffmpeg_version
-            old_cache = self._codec_cache
-            old_strict = self._strict_mode
+        return _TempConfig(self, ffmpeg_path, strict_mode)
 
-            try:
-                if ffmpeg_path is not None:
-                    self.set_ffmpeg_path(ffmpeg_path)
-                if strict_mode is not None:
-                    self._strict_mode = strict_mode
-                yield self
-            finally:
-                # Restaurar estado
-                self._ffmpeg_path = old_path
-                self._ffmpeg_version = old_version
-                self._codec_cache = old_cache
-                self._strict_mode = old_strict
-                if old_path:
-                    plt.rcParams["animation.ffmpeg_path"] = old_path
+
+class _TempConfig:
+    """
+    Context manager de ``FFmpegConfig.temporary_config``.
+
+    Classe com ``__enter__``/``__exit__`` em vez de ``@contextmanager``:
+    entrar no bloco não cria gerador. O lock da configuração fica retido
+    do ``__enter__`` ao ``__exit__``.
+    """
+
+    __slots__ = ("config", "ffmpeg_path", "strict_mode", "_saved")
+
+    def __init__(
+        self,
+        config: FFmpegConfig,
+        ffmpeg_path: Optional[str],
+        strict_mode: Optional[bool],
+    ) -> None:
+        self.config = config
+        self.ffmpeg_path = ffmpeg_path
+        self.strict_mode = strict_mode
+        self._saved: Optional[Tuple[_ConfigState, bool]] = None
+
+    def __enter__(self) -> FFmpegConfig:
+        config = self.config
+        config._lock.acquire()
+        # Guardar estado atual (imutável: basta a referência)
+        self._saved = (config._state, config._strict_mode)
+
+        try:
+            if self.ffmpeg_path is not None:
+                config.set_ffmpeg_path(self.ffmpeg_path)
+            if self.strict_mode is not None:
+                config._strict_mode = self.strict_mode
+        except BaseException:
+            self._restore()
+            raise
+        return config
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._restore()
+
+    def _restore(self) -> None:
+        """Restaura o estado guardado e libera o lock."""
+        config = self.config
+        old_state, old_strict = self._saved  # type: ignore[misc]
+        self._saved = None
+        try:
+            config._state = old_state
+            config._strict_mode = old_strict
+            if old_state.path:
+                _set_matplotlib_ffmpeg_path(old_state.path)
+        finally:
+            config._lock.release()
 
 
 # ============================================================================
@@ -1168,19 +2643,57 @@ class FFmpegConfig:
 # ============================================================================
 
 
+# Instância global; lida sem lock depois de criada (atribuição é atômica).
+# Não usa lru_cache: kwargs diferentes (ex.: strict_mode) criariam instâncias
+# distintas em vez de reaproveitar a primeira.
+_config_instance: Optional[FFmpegConfig] = None
+_config_lock = _RLock()
+
+
+def _container_codec(file_path: str) -> Optional[str]:
+    """Codec que o Matplotlib escolhe pela extensão do arquivo, se houver."""
+    suffix = os.path.splitext(file_path)[1]
+    return suffix[1:] if suffix in CONTAINER_CODEC_EXTENSIONS else None
+
+
+def _get_config(**kwargs: Any) -> FFmpegConfig:
+    """
+    Retorna a configuração global, criando-a na primeira chamada.
+
+    Args:
+        **kwargs: Argumentos para FFmpegConfig (apenas na primeira criação)
+
+    Returns:
+        FFmpegConfig: Instância única
+    """
+    instance = _config_instance
+    if instance is not None:
+        return instance
+    return _create_config(**kwargs)
+
+
+def _create_config(**kwargs: Any) -> FFmpegConfig:
+    """Cria a configuração global sob o lock (double-checked locking)."""
+    global _config_instance
+    with _config_lock:
+        if _config_instance is None:
+            _config_instance = FFmpegConfig(**kwargs)
+        return _config_instance
+
+
 class FFmpegConfigSingleton:
     """
     Singleton thread-safe para configuração global.
 
     Usado para evitar problemas com estado global em ambientes
-    multi-thread ou testes paralelos.
+    multi-thread ou testes paralelos. A instância fica no módulo
+    (``_get_config``), usado diretamente pelas funções de conveniência.
     """
 
-    _instance: Optional[FFmpegConfig] = None
-    _lock: threading.Lock = threading.Lock()
+    __slots__ = ()
 
-    @classmethod
-    def get_instance(cls, **kwargs) -> FFmpegConfig:
+    @staticmethod
+    def get_instance(**kwargs: Any) -> FFmpegConfig:
         """
         Retorna instância singleton (thread-safe).
 
@@ -1190,22 +2703,18 @@ class FFmpegConfigSingleton:
         Returns:
             FFmpegConfig: Instância única
         """
-        if cls._instance is None:
-            with cls._lock:
-                # Double-checked locking
-                if cls._instance is None:
-                    cls._instance = FFmpegConfig(**kwargs)
-        return cls._instance
+        return _get_config(**kwargs)
 
-    @classmethod
-    def reset_instance(cls) -> None:
+    @staticmethod
+    def reset_instance() -> None:
         """
         Reseta a instância singleton.
 
         Útil para testes.
         """
-        with cls._lock:
-            cls._instance = None
+        global _config_instance
+        with _config_lock:
+            _config_instance = None
 
 
 # ============================================================================
@@ -1228,20 +2737,23 @@ def configurar_ffmpeg(caminho: Optional[str] = None, strict_mode: bool = False)
         >>> configurar_ffmpeg()  # Auto-detecta
         >>> configurar_ffmpeg('/usr/bin/ffmpeg')  # Caminho manual
     """
-    config = FFmpegConfigSingleton.get_instance(strict_mode=strict_mode)
+    config = _get_config(strict_mode=strict_mode)
 
     if caminho:
         try:
             config.set_ffmpeg_path(caminho)
-            return True
         except (FFmpegNotFoundError, ValueError) as e:
             logger.error("Erro ao configurar FFmpeg: %s", e)
             return False
-    else:
-        return config.auto_detect_ffmpeg()
+    elif not config.auto_detect_ffmpeg():
+        return False
 
+    # Caminho definitivo: consulta versão/codecs em paralelo com o script
+    config.warm_up()
+    return True
 
-def criar_writer(fps: int = 20, quality: str = "high", **kwargs) -> FFMpegWriter:
+
+def criar_writer(fps: int = 20, quality: str = "high", **kwargs: Any) -> "FFMpegWriter":
     """
     Cria um writer FFmpeg (usando singleton).
 
@@ -1256,11 +2768,11 @@ def criar_writer(fps: int = 20, quality: str = "high", **kwargs) -> FFMpegWriter
     Example:
         >>> writer = criar_writer(fps=30, quality='ultra')
     """
-    config = FFmpegConfigSingleton.get_instance()
+    config = _get_config()
     return config.create_writer(fps=fps, quality=quality, **kwargs)
 
 
-def salvar_animacao(animation: FuncAnimation, filename: str, **kwargs) -> str:
+def salvar_animacao(animation: "FuncAnimation", filename: str, **kwargs: Any) -> str:
     """
     Salva uma animação (usando singleton).
 
@@ -1275,10 +2787,29 @@ def salvar_animacao(animation: FuncAnimation, filename: str, **kwargs) -> str:
     Example:
         >>> caminho = salvar_animacao(ani, 'video.mp4', fps=30, quality='high')
     """
-    config = FFmpegConfigSingleton.get_instance()
+    config = _get_config()
     return config.save_animation(animation, filename, **kwargs)
 
 
+def otimizar_matplotlib_para_animacao() -> None:
+    """
+    Ajusta rcParams do Matplotlib para desenhar frames mais rápido.
+
+    Simplifica caminhos com mais agressividade (``path.simplify_threshold``
+    1.0) e divide caminhos longos em blocos no Agg (``agg.path.chunksize``).
+    Os ajustes são globais e valem para todas as figuras; para limitar o
+    escopo, use ``matplotlib.rc_context(ANIMATION_RCPARAMS)``.
+
+    Example:
+        >>> otimizar_matplotlib_para_animacao()
+        >>> salvar_animacao(ani, 'video.mp4')
+    """
+    import matplotlib as mpl
+
+    # Os stubs tipam as chaves do rcParams como Literal
+    mpl.rcParams.update(cast(Any, ANIMATION_RCPARAMS))
+
+
 def obter_config_global() -> FFmpegConfig:
     """
     Retorna a instância de configuração singleton.
@@ -1286,7 +2817,7 @@ def obter_config_global() -> FFmpegConfig:
     Returns:
         FFmpegConfig: Instância de configuração
     """
-    return FFmpegConfigSingleton.get_instance()
+    return _get_config()
 
 
 # ============================================================================
@@ -1303,7 +2834,7 @@ if __name__ == "__main__":
 
     exemplo_uso = """
 # 1. Configuração básica com modo strict
-from ffmpeg_config_improved import FFmpegConfig, SaveOptions
+from ffmpeg_matplotlib.config import FFmpegConfig, SaveOptions
 
 config = FFmpegConfig(strict_mode=True)  # Fail-fast, sem fallbacks
 
@@ -1329,7 +2860,7 @@ options = SaveOptions(
 caminho = config.save_animation(animacao, 'video.mp4', options=options)
 
 # 6. Estimativa de tamanho
-from ffmpeg_config_improved import DiskSpaceValidator, Quality
+from ffmpeg_matplotlib.config import DiskSpaceValidator, Quality
 
 size = DiskSpaceValidator.estimate_video_size(
     duration=60,  # segundos
@@ -1344,7 +2875,7 @@ with config.temporary_config(strict_mode=False):
     config.save_animation(ani, 'temp.mp4')
 
 # 8. Funções de conveniência (singleton único)
-from ffmpeg_config_improved import configurar_ffmpeg, salvar_animacao
+from ffmpeg_matplotlib import configurar_ffmpeg, salvar_animacao
 
 configurar_ffmpeg(strict_mode=True)
 salvar_animacao(ani, 'video.mp4', quality='ultra', check_disk_space=True)
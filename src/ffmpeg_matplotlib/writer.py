@@ -0,0 +1,293 @@
+"""
+Writer FFmpeg com buffer ampliado para animações Matplotlib
+==========================================================
+
+Este módulo fornece uma subclasse de ``FFMpegWriter`` que amplia o
+buffer do pipe usado para enviar os frames ao FFmpeg, reduzindo o
+número de syscalls de escrita e o tempo em que o Matplotlib fica
+bloqueado esperando o encoder consumir os dados.
+
+==========================================================
+"""
+
+import io
+import logging
+import subprocess
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import IO, Any, Callable, Deque, Dict, Final, Iterator, List, Optional, Union, cast
+
+import matplotlib as mpl
+from matplotlib import animation as mpl_animation
+from matplotlib.animation import FFMpegWriter
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# Constantes
+# ============================================================================
+
+# Tamanho do buffer do pipe stdin do FFmpeg (1 MiB)
+PIPE_BUFFER_SIZE: Final[int] = 1 << 20
+
+# fcntl.F_SETPIPE_SZ (Linux); exposto pelo módulo fcntl apenas no Python 3.10+
+_F_SETPIPE_SZ: Final[int] = 1031
+
+# Frames renderizando simultaneamente por worker (limita a memória em uso)
+FRAMES_IN_FLIGHT_PER_WORKER: Final[int] = 2
+
+
+# ============================================================================
+# Utilitários
+# ============================================================================
+
+
+class _CountingStream:
+    """Encaminha escritas para outro stream contando os bytes enviados."""
+
+    def __init__(self, stream: Any):
+        self._stream = stream
+        self.bytes_written = 0
+
+    def write(self, data: Any) -> Any:
+        self.bytes_written += memoryview(data).nbytes
+        return self._stream.write(data)
+
+    def __getattr__(self, name: str) -> Any:
+        # savefig exige um objeto com a interface de arquivo (seek, flush...)
+        return getattr(self._stream, name)
+
+
+# ============================================================================
+# Writer com Buffer
+# ============================================================================
+
+
+class BufferedFFMpegWriter(FFMpegWriter):
+    """
+    FFMpegWriter com buffer de escrita ampliado no pipe do FFmpeg.
+
+    Cada frame RGBA pode ter vários MB, enquanto o pipe padrão do sistema
+    operacional tem 64 KiB (Linux) ou 4 KiB (Windows). O processo é criado
+    com ``bufsize=PIPE_BUFFER_SIZE`` e, no Linux, o próprio pipe do kernel
+    é ampliado via ``F_SETPIPE_SZ``.
+
+    Com canvas Agg, cada frame é enviado direto do buffer RGBA do
+    renderer (uma memoryview, sem cópia) em vez de passar por
+    ``savefig``, que troca o DPI da figura e reconfigura o canvas a cada
+    frame.
+
+    Attributes:
+        bytes_sent (int): Total de bytes de frames enviados ao FFmpeg
+    """
+
+    # Definidos por MovieWriter.setup (ausentes dos stubs do Matplotlib)
+    _w: float
+    _h: float
+
+    def setup(self, fig: Any, outfile: Union[str, Path], dpi: Optional[float] = None) -> None:
+        """Prepara o writer e fixa o DPI da figura durante o salvamento."""
+        super().setup(fig, outfile, dpi=dpi)
+        self.bytes_sent = 0
+        self._original_dpi: Optional[float] = None
+        self._fast_path = (
+            self.frame_format == "rgba"
+            and hasattr(fig.canvas, "buffer_rgba")
+            and hasattr(fig.canvas, "is_saving")
+            and mpl.rcParams["savefig.facecolor"] == "auto"
+            and mpl.rcParams["savefig.edgecolor"] == "auto"
+            and not mpl.rcParams["savefig.transparent"]
+        )
+
+    def grab_frame(self, **savefig_kwargs: Any) -> None:
+        """
+        Captura o frame atual e envia ao FFmpeg.
+
+        Args:
+            **savefig_kwargs: Repassados ao savefig (desativam o caminho rápido)
+        """
+        # buffer_rgba existe no canvas Agg (conferido em setup)
+        canvas: Any = self.fig.canvas
+        # Fora de Animation.save, draw() omite artistas animated=True; sem
+        # canvas.saving() (API pública) só o savefig os desenha
+        saving = canvas.is_saving() or hasattr(canvas, "saving")
+        if savefig_kwargs or not self._fast_path or not saving:
+            self._grab_frame_savefig(**savefig_kwargs)
+            return
+
+        # Todos os frames precisam ter o mesmo tamanho
+        self.fig.set_size_inches(self._w, self._h)
+        if self.fig.dpi != self.dpi:
+            if self._original_dpi is None:
+                self._original_dpi = self.fig.dpi
+            self.fig.set_dpi(self.dpi)
+
+        if canvas.is_saving():
+            canvas.draw()
+        else:
+            with canvas.saving():
+                canvas.draw()
+        frame = canvas.buffer_rgba()
+
+        width, height = self.frame_size
+        if frame.shape[:2] != (height, width):
+            # Arredondamento do canvas difere do tamanho esperado pelo FFmpeg
+            logger.debug("Buffer %s difere do frame esperado", frame.shape)
+            self._grab_frame_savefig()
+            return
+
+        self._stdin().write(frame)
+        self.bytes_sent += frame.nbytes
+
+    def _grab_frame_savefig(self, **savefig_kwargs: Any) -> None:
+        """Captura o frame via savefig (caminho padrão), contando os bytes."""
+        stdin = self._stdin()
+        counter = _CountingStream(stdin)
+        self._proc.stdin = cast(IO[bytes], counter)
+        try:
+            super().grab_frame(**savefig_kwargs)
+        finally:
+            self._proc.stdin = stdin
+            self.bytes_sent += counter.bytes_written
+
+    def grab_frame_raw(self, frame: Any) -> None:
+        """
+        Envia ao FFmpeg um frame RGBA já renderizado.
+
+        Args:
+            frame: Buffer RGBA (bytes, memoryview ou array) do tamanho do frame
+
+        Raises:
+            ValueError: Se o tamanho do buffer não corresponder ao frame
+        """
+        nbytes = memoryview(frame).nbytes
+        width, height = self.frame_size
+        if nbytes != width * height * 4:
+            raise ValueError(
+                f"Frame com {nbytes} bytes; esperado {width}x{height} RGBA "
+                f"({width * height * 4} bytes)"
+            )
+
+        self._stdin().write(frame)
+        self.bytes_sent += nbytes
+
+    def finish(self) -> None:
+        """Finaliza o FFmpeg e restaura o DPI original da figura."""
+        try:
+            super().finish()
+        finally:
+            original_dpi = getattr(self, "_original_dpi", None)
+            if original_dpi is not None:
+                self.fig.set_dpi(original_dpi)
+                self._original_dpi = None
+
+    def _stdin(self) -> IO[bytes]:
+        """Retorna o pipe de entrada do FFmpeg (criado com stdin=PIPE)."""
+        stdin = self._proc.stdin
+        assert stdin is not None, "Processo FFmpeg sem pipe de entrada"
+        return stdin
+
+    def _run(self) -> None:
+        """Inicia o processo FFmpeg com stdin bufferizado."""
+        command: List[str] = self._args()  # type: ignore[attr-defined]
+        logger.debug("Executando FFmpeg: %s", " ".join(command))
+        self._proc = subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=PIPE_BUFFER_SIZE,
+            creationflags=getattr(mpl_animation, "subprocess_creation_flags", 0),
+        )
+        self._enlarge_pipe()
+
+    def _enlarge_pipe(self) -> None:
+        """
+        Amplia o pipe do kernel (apenas Linux).
+
+        Falhas são ignoradas: o tamanho máximo pode ser limitado por
+        /proc/sys/fs/pipe-max-size e o buffer do Popen já ajuda sozinho.
+        """
+        try:
+            import fcntl
+
+            set_pipe_size = getattr(fcntl, "F_SETPIPE_SZ", _F_SETPIPE_SZ)
+            fcntl.fcntl(self._stdin().fileno(), set_pipe_size, PIPE_BUFFER_SIZE)
+        except (ImportError, OSError, ValueError) as e:
+            logger.debug("Não foi possível ampliar o pipe do FFmpeg: %s", e)
+
+
+# ============================================================================
+# Renderização Paralela
+# ============================================================================
+
+# Estado de cada processo worker (figura própria, criada uma única vez)
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_render_worker(
+    fig_factory: Callable[[], Any], update_fn: Callable[[Any, int], Any], dpi: float
+) -> None:
+    """Inicializa um processo worker com backend Agg e figura própria."""
+    mpl.use("Agg")
+    # Mesmo comportamento de Animation.save: bbox 'tight' mudaria o tamanho
+    mpl.rcParams["savefig.bbox"] = "standard"
+    _worker_state["fig"] = fig_factory()
+    _worker_state["update_fn"] = update_fn
+    _worker_state["dpi"] = dpi
+
+
+def _render_frame(frame: int) -> bytes:
+    """Atualiza a figura do worker para o frame e retorna o buffer RGBA."""
+    fig = _worker_state["fig"]
+    _worker_state["update_fn"](fig, frame)
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="rgba", dpi=_worker_state["dpi"])
+    return buffer.getvalue()
+
+
+def render_frames_parallel(
+    fig_factory: Callable[[], Any],
+    update_fn: Callable[[Any, int], Any],
+    num_frames: int,
+    dpi: float,
+    workers: int,
+) -> Iterator[bytes]:
+    """
+    Renderiza frames em processos separados e os entrega em ordem.
+
+    No máximo ``workers * FRAMES_IN_FLIGHT_PER_WORKER`` frames ficam em
+    memória ao mesmo tempo, então um consumidor lento (o FFmpeg) não faz
+    os frames renderizados se acumularem.
+
+    Args:
+        fig_factory: Função sem argumentos que cria a figura (piclável)
+        update_fn: Função (figura, índice do frame) que atualiza a figura (piclável)
+        num_frames: Número total de frames
+        dpi: Resolução de renderização
+        workers: Número de processos
+
+    Yields:
+        bytes: Buffer RGBA de cada frame, na ordem dos índices
+    """
+    window = workers * FRAMES_IN_FLIGHT_PER_WORKER
+    pending: Deque["Future[bytes]"] = deque()
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_render_worker,
+        initargs=(fig_factory, update_fn, dpi),
+    ) as executor:
+        try:
+            next_frame = 0
+            while next_frame < num_frames or pending:
+                while next_frame < num_frames and len(pending) < window:
+                    pending.append(executor.submit(_render_frame, next_frame))
+                    next_frame += 1
+                yield pending.popleft().result()
+        finally:
+            # Consumidor interrompido: descartar frames ainda não iniciados
+            for future in pending:
+                future.cancel()
@@ -2,27 +2,42 @@
 Fixtures compartilhadas para testes
 """
 
-import shutil
-import tempfile
-from pathlib import Path
-
-import matplotlib.pyplot as plt
-import numpy as np
 import pytest
-from matplotlib.animation import FuncAnimation
 
 
 @pytest.fixture
-def temp_dir():
-    """Cria diretório temporário para testes"""
-    tmp = tempfile.mkdtemp()
-    yield Path(tmp)
-    shutil.rmtree(tmp, ignore_errors=True)
+def temp_dir(tmp_path):
+    """Diretório temporário exclusivo do teste (pode ser alterado)"""
+    return tmp_path
+
+
+@pytest.fixture(scope="session")
+def shared_temp_dir(tmp_path_factory):
+    """Diretório temporário da sessão (apenas leitura nos testes)"""
+    return tmp_path_factory.mktemp("compartilhado")
+
+
+@pytest.fixture(scope="session")
+def sin_frames():
+    """Dados dos frames de simple_animation (calculados uma vez por sessão)"""
+    import numpy as np
+
+    x = np.linspace(0, 2 * np.pi, 100)
+    # Matriz (10, 100): um único np.sin para todas as fases
+    ys = np.sin(x[None, :] + np.arange(10)[:, None] / 10)
+    return x, ys
 
 
 @pytest.fixture
-def simple_animation():
+def simple_animation(sin_frames):
     """Cria animação simples para testes"""
+    # Importados aqui: a coleta não paga o import do Matplotlib/NumPy
+    import matplotlib.pyplot as plt
+    import numpy as np
+    from matplotlib.animation import FuncAnimation
+
+    # Figura por teste (testes podem alterá-la); dados compartilhados
+    x, ys = sin_frames
     fig, ax = plt.subplots()
     ax.set_xlim(0, 2 * np.pi)
     ax.set_ylim(-1, 1)
@@ -33,22 +48,125 @@ def simple_animation():
         return (line,)
 
     def update(frame):
-        x = np.linspace(0, 2 * np.pi, 100)
-        y = np.sin(x + frame / 10)
-        line.set_data(x, y)
+        line.set_data(x, ys[frame])
         return (line,)
 
-    ani = FuncAnimation(fig, update, init_func=init, frames=10)
+    # blit: redesenha só a linha; sem cache de frames (dados já em memória)
+    ani = FuncAnimation(
+        fig,
+        update,
+        init_func=init,
+        frames=len(ys),
+        blit=True,
+        cache_frame_data=False,
+    )
 
     yield ani
 
+    # Testes com save simulado não a renderizam: evita o aviso do Matplotlib
+    ani._draw_was_started = True
     plt.close(fig)
 
 
 @pytest.fixture
 def mock_ffmpeg_path(temp_dir):
-    """Cria executável FFmpeg fake para testes"""
+    """Cria executável FFmpeg fake para testes que o alteram"""
     ffmpeg = temp_dir / "ffmpeg"
     ffmpeg.touch()
     ffmpeg.chmod(0o755)
     return str(ffmpeg)
+
+
+@pytest.fixture(scope="session")
+def shared_mock_ffmpeg_path(shared_temp_dir):
+    """Executável FFmpeg fake da sessão (não deve ser alterado)"""
+    ffmpeg = shared_temp_dir / "ffmpeg"
+    ffmpeg.touch()
+    ffmpeg.chmod(0o755)
+    return str(ffmpeg)
+
+
+@pytest.fixture(scope="session")
+def configurar_ffmpeg_result(tmp_path_factory):
+    """Resultado de configurar_ffmpeg() real (detecção paga uma vez por sessão)"""
+    from ffmpeg_matplotlib.config import configurar_ffmpeg, obter_config_global
+
+    # Fixture de sessão roda fora do _isolated_disk_cache: isolar aqui também
+    cache_dir = str(tmp_path_factory.mktemp("cache"))
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("XDG_CACHE_HOME", cache_dir)
+        monkeypatch.setenv("LOCALAPPDATA", cache_dir)
+        result = configurar_ffmpeg()
+        # A consulta de fundo grava o cache em disco: aguardar dentro do contexto
+        warm_up = obter_config_global()._warm_up_thread
+        if warm_up is not None:
+            warm_up.join()
+        return result
+
+
+@pytest.fixture
+def unconfigured():
+    """Cria FFmpegConfig sem FFmpeg configurado (sem auto-detecção)"""
+    from ffmpeg_matplotlib.config import FFmpegConfig
+
+    return FFmpegConfig(auto_detect=False)
+
+
+@pytest.fixture
+def configured_config(shared_mock_ffmpeg_path):
+    """Cria FFmpegConfig configurado com validator fake (sem FFmpeg real)"""
+    from ffmpeg_matplotlib.config import (
+        CodecQueryResult,
+        FFmpegConfig,
+        FFmpegValidator,
+        ValidationResult,
+    )
+
+    class FakeValidator(FFmpegValidator):
+        def validate_and_query(self, path):
+            validation = ValidationResult(is_valid=True, path=path, version=(6, 0, 0))
+            return validation, self.query_available_codecs(path)
+
+        def query_available_codecs(self, ffmpeg_path):
+            return CodecQueryResult(codecs=frozenset({"libx264", "mpeg4"}), using_fallback=False)
+
+    return FFmpegConfig(ffmpeg_path=shared_mock_ffmpeg_path, validator=FakeValidator())
+
+
+@pytest.fixture
+def real_config():
+    """Cria FFmpegConfig com o FFmpeg real (pula o teste se não houver)"""
+    from ffmpeg_matplotlib.config import FFmpegConfig
+
+    config = FFmpegConfig()
+    if not config.configured:
+        pytest.skip("FFmpeg real não encontrado")
+    return config
+
+
+@pytest.fixture(autouse=True)
+def _clear_process_caches():
+    """Isola testes dos caches compartilhados no processo"""
+    from ffmpeg_matplotlib.config import DiskSpaceValidator, FFmpegDetector
+
+    FFmpegDetector.invalidate()
+    DiskSpaceValidator.invalidate_cache()
+    yield
+    FFmpegDetector.invalidate()
+    DiskSpaceValidator.invalidate_cache()
+
+
+@pytest.fixture(autouse=True)
+def _no_ffmpeg_env_vars(monkeypatch):
+    """Impede que FFMPEG_BINARY/IMAGEIO_FFMPEG_EXE do ambiente afetem a detecção"""
+    from ffmpeg_matplotlib.config import FFMPEG_ENV_VARS
+
+    for env_var in FFMPEG_ENV_VARS:
+        monkeypatch.delenv(env_var, raising=False)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_disk_cache(tmp_path, monkeypatch):
+    """Direciona o cache em disco de codecs para um diretório temporário"""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setenv("LOCALAPPDATA", str(tmp_path / "cache"))
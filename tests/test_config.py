@@ -2,15 +2,41 @@
 Testes básicos para FFmpegConfig
 """
 
+import importlib
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
 import warnings
+from dataclasses import replace
+from unittest.mock import patch
 
-import matplotlib.pyplot as plt
 import pytest
-from matplotlib.animation import FuncAnimation
 
 from ffmpeg_matplotlib import __version__
-from ffmpeg_matplotlib.config import (FFmpegConfig, FFmpegNotConfiguredError,
-                                      configurar_ffmpeg)
+from ffmpeg_matplotlib.config import (
+    CODEC_CACHE_TTL,
+    PROGRESS_LOG_INTERVAL,
+    CodecQueryResult,
+    DiskSpaceValidator,
+    FFmpegConfig,
+    FFmpegConfigSingleton,
+    FFmpegDetector,
+    FFmpegNotConfiguredError,
+    FFmpegNotFoundError,
+    FFmpegValidator,
+    InvalidCodecError,
+    Quality,
+    SaveOptions,
+    StrictModeError,
+    ValidationResult,
+    configurar_ffmpeg,
+    obter_config_global,
+    otimizar_matplotlib_para_animacao,
+)
 
 warnings.filterwarnings("ignore", category=UserWarning, module="matplotlib")
 
@@ -18,44 +44,495 @@ warnings.filterwarnings("ignore", category=UserWarning, module="matplotlib")
 class TestFFmpegConfigInit:
     """Testes de inicialização"""
 
-    def test_config_without_auto_detect(self):
+    def test_config_without_auto_detect(self, unconfigured):
         """Testa criação sem auto-detecção"""
-        config = FFmpegConfig(auto_detect=False)
-        assert not config.configured
+        assert not unconfigured.configured
 
-    def test_config_has_version_property(self):
+    def test_config_has_version_property(self, unconfigured):
         """Testa que config tem propriedade version"""
-        config = FFmpegConfig(auto_detect=False)
-        assert hasattr(config, "version")
-        assert hasattr(config, "version_string")
+        assert hasattr(unconfigured, "version")
+        assert hasattr(unconfigured, "version_string")
 
 
 class TestFFmpegConfigProperties:
     """Testes de propriedades"""
 
-    def test_configured_property(self):
+    def test_configured_property(self, unconfigured):
         """Testa propriedade configured"""
-        config = FFmpegConfig(auto_detect=False)
-        assert isinstance(config.configured, bool)
-        assert not config.configured
+        assert isinstance(unconfigured.configured, bool)
+        assert not unconfigured.configured
 
-    def test_ffmpeg_path_property(self):
+    def test_ffmpeg_path_property(self, unconfigured):
         """Testa propriedade ffmpeg_path"""
-        config = FFmpegConfig(auto_detect=False)
-        assert config.ffmpeg_path is None
+        assert unconfigured.ffmpeg_path is None
 
-    def test_version_string(self):
+    def test_version_string(self, unconfigured):
         """Testa version_string com FFmpeg não configurado"""
-        config = FFmpegConfig(auto_detect=False)
-        assert config.version_string == "Desconhecida"
+        assert unconfigured.version_string == "Desconhecida"
+
+    def test_version_string_configured(self, configured_config):
+        """Testa version_string formatada ao configurar o FFmpeg"""
+        assert configured_config.version_string == "6.0.0"
+        assert configured_config.version_string is configured_config.version_string
+
+    def test_no_instance_dict(self, unconfigured):
+        """Testa que FFmpegConfig usa __slots__ (atributos extras são recusados)"""
+        with pytest.raises(AttributeError):
+            unconfigured.atributo_inexistente = True
+
+    def test_temporary_config_restores_state(self, configured_config, temp_dir):
+        """Testa que temporary_config restaura o mesmo estado imutável"""
+        configured_config.get_available_codecs()
+        state = configured_config._state
+        other_path = temp_dir / "outro_ffmpeg"
+        other_path.write_text("fake")
+
+        with configured_config.temporary_config(ffmpeg_path=str(other_path)):
+            assert configured_config.ffmpeg_path == str(other_path)
+
+        assert configured_config._state is state
+        assert configured_config.ffmpeg_path == state.path
+
+    def test_temporary_config_invalid_path_restores(self, configured_config):
+        """Testa que caminho inválido na entrada restaura o estado e o lock"""
+        state = configured_config._state
+
+        with patch.object(
+            FFmpegConfig,
+            "set_ffmpeg_path",
+            side_effect=FFmpegNotFoundError("inválido"),
+        ), pytest.raises(FFmpegNotFoundError):
+            with configured_config.temporary_config(ffmpeg_path="/nao/existe"):
+                pass
+
+        assert configured_config._state is state
+        acquired = []
+
+        def try_lock():
+            acquired.append(configured_config._lock.acquire(False))
+            if acquired[-1]:
+                configured_config._lock.release()
+
+        thread = threading.Thread(target=try_lock)
+        thread.start()
+        thread.join()
+        assert acquired == [True]
+
+    def test_same_path_skips_rcparams_write(self, configured_config):
+        """Testa que reconfigurar o mesmo caminho não reescreve rcParams"""
+        import matplotlib
+
+        path = configured_config.ffmpeg_path
+        assert matplotlib.rcParams["animation.ffmpeg_path"] == path
+
+        with patch.object(matplotlib.RcParams, "__setitem__") as setitem:
+            configured_config.set_ffmpeg_path(path)
+        assert setitem.call_count == 0
+
+
+class TestAutoDetectFFmpeg:
+    """Testes de configuração via auto-detecção"""
+
+    def test_auto_detect_defers_version_probe(self, shared_mock_ffmpeg_path):
+        """Testa que auto-detecção não executa o FFmpeg até a versão ser pedida"""
+        detector = FFmpegDetector()
+        validator = FFmpegValidator()
+        validation = ValidationResult(
+            is_valid=True, path=shared_mock_ffmpeg_path, version=(6, 1, 0)
+        )
+        codecs = CodecQueryResult(codecs={"libx264"}, using_fallback=False)
+
+        with patch.object(
+            detector, "auto_detect", return_value=shared_mock_ffmpeg_path
+        ), patch.object(
+            validator, "validate_and_query", return_value=(validation, codecs)
+        ) as validate:
+            config = FFmpegConfig(detector=detector, validator=validator)
+            assert config.configured
+            assert validate.call_count == 0
+
+            assert config.version_string == "6.1.0"
+            assert config.version == (6, 1, 0)
+            assert validate.call_count == 1
+            assert config.get_available_codecs() == {"libx264"}
+
+    def test_warm_up_probes_in_background(self, shared_mock_ffmpeg_path):
+        """Testa que warm_up consulta versão e codecs em uma thread de fundo"""
+        detector = FFmpegDetector()
+        validator = FFmpegValidator()
+        validation = ValidationResult(
+            is_valid=True, path=shared_mock_ffmpeg_path, version=(6, 1, 0)
+        )
+        codecs = CodecQueryResult(codecs=frozenset({"libx264"}), using_fallback=False)
+
+        with patch.object(
+            detector, "auto_detect", return_value=shared_mock_ffmpeg_path
+        ), patch.object(
+            validator, "validate_and_query", return_value=(validation, codecs)
+        ) as validate:
+            config = FFmpegConfig(detector=detector, validator=validator)
+            config.warm_up().join()
+            assert validate.call_count == 1
+
+            assert config.version == (6, 1, 0)
+            config.validate_codec("libx264", strict=True)
+            assert validate.call_count == 1
+            assert config.warm_up() is None
+
+    def test_warm_up_reuses_running_thread(self, configured_config):
+        """Testa que warm_up não inicia outra thread com uma em execução"""
+        configured_config._state = replace(configured_config._state, codec_cache=None)
+        release = threading.Event()
+        with patch.object(
+            FFmpegConfig, "_get_available_codecs", side_effect=lambda: release.wait(5)
+        ) as query:
+            thread = configured_config.warm_up()
+            assert configured_config.warm_up() is thread
+            release.set()
+            thread.join(5)
+        assert query.call_count == 1
+
+    def test_warm_up_ignores_ffmpeg_errors(self, configured_config):
+        """Testa que erros do FFmpeg na thread de fundo não propagam"""
+        configured_config._state = replace(configured_config._state, codec_cache=None)
+        with patch.object(
+            FFmpegConfig,
+            "_get_available_codecs",
+            side_effect=FFmpegNotConfiguredError("sem FFmpeg"),
+        ) as query:
+            configured_config.warm_up().join()
+        assert query.call_count == 1
+
+    def test_env_var_takes_precedence(self, shared_mock_ffmpeg_path, monkeypatch):
+        """Testa que FFMPEG_BINARY é usado antes do detector"""
+        monkeypatch.setenv("FFMPEG_BINARY", shared_mock_ffmpeg_path)
+        detector = FFmpegDetector()
+        validator = FFmpegValidator()
+        validation = ValidationResult(
+            is_valid=True, path=shared_mock_ffmpeg_path, version=(6, 1, 0)
+        )
+        codecs = CodecQueryResult(codecs={"libx264"}, using_fallback=False)
+
+        with patch.object(detector, "auto_detect") as auto_detect, patch.object(
+            validator, "validate_and_query", return_value=(validation, codecs)
+        ):
+            config = FFmpegConfig(detector=detector, validator=validator)
+
+        assert auto_detect.call_count == 0
+        assert config.ffmpeg_path == shared_mock_ffmpeg_path
+
+
+CODECS_OUTPUT = b"""Codecs:
+ D..... = Decoding supported
+ -------
+ DEV.LS h264                 H.264 / AVC / MPEG-4 AVC
+ DEV.L. mpeg4                MPEG-4 part 2
+ DEA.L. aac                  AAC (Advanced Audio Coding)
+"""
+
+
+class TestParseVersion:
+    """Testes de extração da versão do FFmpeg"""
+
+    @pytest.mark.parametrize(
+        "banner, expected",
+        [
+            ("ffmpeg version 6.1.1 Copyright", (6, 1, 1)),
+            ("ffmpeg version 4.4.2-0ubuntu0.22.04.1 Copyright", (4, 4, 2)),
+            ("ffmpeg version 7.1 Copyright", (7, 1, 0)),
+            ("ffmpeg version n7.0.2 Copyright", (7, 0, 2)),
+            ("ffmpeg version N-112345-gabcdef Copyright", (99, 0, 112345)),
+            ("ffprobe version 6.1.1", None),
+        ],
+    )
+    def test_parse_version(self, banner, expected):
+        """Testa formatos de versão (texto e bytes) de release e snapshot"""
+        assert FFmpegValidator.parse_version(banner) == expected
+        assert FFmpegValidator.parse_version(banner.encode()) == expected
+
+
+class TestParseCodecs:
+    """Testes de parsing da saída de 'ffmpeg -codecs'"""
+
+    @pytest.fixture(params=[False, True], ids=["scanner", "regex"], autouse=True)
+    def parser(self, request, monkeypatch):
+        """Executa cada teste com o scanner de colunas e com a regex"""
+        monkeypatch.setattr("ffmpeg_matplotlib.config._USE_CODEC_REGEX", request.param)
+
+    def test_parse_codecs(self):
+        """Testa que apenas codecs de vídeo são extraídos"""
+        assert FFmpegValidator.parse_codecs(CODECS_OUTPUT.decode()) == {"h264", "mpeg4"}
+
+    def test_match_does_not_cross_lines(self):
+        """Testa que flags sem nome não capturam a linha seguinte"""
+        output = " -------\n DEV.LS\nh264 descrição\n"
+        assert FFmpegValidator.parse_codecs(output) == set()
+
+    def test_legend_is_ignored(self):
+        """Testa que a legenda sob o cabeçalho 'Codecs:' não vira codec"""
+        output = "Codecs:\n ..V... = Video codec\n DEV.LS h264 H.264\n"
+        assert FFmpegValidator.parse_codecs(output) == {"h264"}
+
+
+class TestCodecDiskCache:
+    """Testes do cache em disco de codecs"""
+
+    def query(self, ffmpeg_path):
+        """Consulta codecs com FFmpeg simulado; retorna (resultado, execuções)"""
+        completed = subprocess.CompletedProcess([], 0, stdout=CODECS_OUTPUT)
+        with patch("subprocess.run", return_value=completed) as run:
+            result = FFmpegValidator.query_available_codecs(ffmpeg_path)
+        return result, run.call_count
+
+    def test_second_query_uses_disk_cache(self, shared_mock_ffmpeg_path):
+        """Testa que a segunda consulta não executa o FFmpeg"""
+        first, first_calls = self.query(shared_mock_ffmpeg_path)
+        second, second_calls = self.query(shared_mock_ffmpeg_path)
+
+        assert first.codecs == {"h264", "mpeg4"}
+        assert second.codecs == first.codecs
+        assert not second.using_fallback
+        assert (first_calls, second_calls) == (1, 0)
+
+    def test_cached_timestamp_is_monotonic(self, shared_mock_ffmpeg_path):
+        """Testa que o instante do cache em disco é convertido para monotonic"""
+        self.query(shared_mock_ffmpeg_path)
+        cached, _ = self.query(shared_mock_ffmpeg_path)
+
+        now = time.monotonic()
+        assert cached.timestamp <= now
+        assert not cached.is_expired(now=now)
+        assert cached.is_expired(ttl=10, now=now + 11)
+
+    def test_changed_executable_invalidates_cache(self, mock_ffmpeg_path):
+        """Testa que alterar o executável invalida o cache"""
+        self.query(mock_ffmpeg_path)
+        with open(mock_ffmpeg_path, "w") as f:
+            f.write("nova versão")
+
+        _, calls = self.query(mock_ffmpeg_path)
+        assert calls == 1
+
+    def test_corrupt_cache_is_ignored(self, shared_mock_ffmpeg_path, tmp_path):
+        """Testa que cache corrompido cai para a consulta ao FFmpeg"""
+        cache_file = tmp_path / "cache" / "ffmpeg-matplotlib" / "codecs.json"
+        cache_file.parent.mkdir(parents=True)
+        cache_file.write_text("{corrompido")
+
+        result, calls = self.query(shared_mock_ffmpeg_path)
+        assert result.codecs == {"h264", "mpeg4"}
+        assert calls == 1
+
+
+class TestValidateAndQuery:
+    """Testes de validação e consulta de codecs combinadas"""
+
+    def run(self, ffmpeg_path):
+        """Valida com FFmpeg simulado; retorna (validação, codecs, execuções)"""
+        completed = subprocess.CompletedProcess(
+            [], 0, stdout=CODECS_OUTPUT, stderr=b"ffmpeg version 6.1.1 Copyright"
+        )
+        with patch("subprocess.run", return_value=completed) as run:
+            validation, codecs = FFmpegValidator.validate_and_query(ffmpeg_path)
+        return validation, codecs, run.call_count
+
+    def test_single_subprocess(self, shared_mock_ffmpeg_path):
+        """Testa que versão e codecs vêm de uma única execução"""
+        validation, codecs, calls = self.run(shared_mock_ffmpeg_path)
+
+        assert validation.is_valid
+        assert validation.version == (6, 1, 1)
+        assert codecs.codecs == {"h264", "mpeg4"}
+        assert calls == 1
+
+    def test_second_validation_uses_disk_cache(self, shared_mock_ffmpeg_path):
+        """Testa que a segunda validação não executa o FFmpeg"""
+        self.run(shared_mock_ffmpeg_path)
+        validation, codecs, calls = self.run(shared_mock_ffmpeg_path)
+
+        assert validation.version == (6, 1, 1)
+        assert codecs.codecs == {"h264", "mpeg4"}
+        assert calls == 0
+
+    def test_strict_mode_rejects_cached_fallback(self, configured_config):
+        """Testa que modo strict rejeita fallback também quando já em cache"""
+        fallback = CodecQueryResult(codecs={"libx264"}, using_fallback=True)
+        configured_config._state = replace(configured_config._state, codec_cache=None)
+        configured_config._strict_mode = True
+
+        with patch.object(
+            configured_config.validator,
+            "query_available_codecs",
+            return_value=fallback,
+        ):
+            for _ in range(2):
+                with pytest.raises(StrictModeError):
+                    configured_config.get_available_codecs()
+
+    def test_cached_codecs_skip_lock(self, configured_config):
+        """Testa que codecs em cache são retornados sem lock e sem cópia"""
+        codecs = configured_config.get_available_codecs()
+        configured_config._lock = None  # Qualquer uso do lock falharia
+
+        assert isinstance(codecs, frozenset)
+        assert configured_config.get_available_codecs() is codecs
+
+
+class TestDiskSpace:
+    """Testes de verificação de espaço em disco"""
+
+    def test_nonexistent_output_uses_parent(self, temp_dir):
+        """Testa que arquivo ainda inexistente usa o diretório pai"""
+        available = DiskSpaceValidator.get_available_space(temp_dir / "video.mp4")
+        assert 0 <= available < float("inf")
+
+    def test_available_space_is_cached(self, temp_dir):
+        """Testa que consultas no mesmo dispositivo reaproveitam o resultado"""
+        with patch("shutil.disk_usage", wraps=shutil.disk_usage) as disk_usage:
+            DiskSpaceValidator.get_available_space(temp_dir / "a.mp4")
+            DiskSpaceValidator.get_available_space(temp_dir / "b.mp4")
+            assert disk_usage.call_count == 1
+
+            DiskSpaceValidator.invalidate_cache()
+            DiskSpaceValidator.get_available_space(temp_dir / "a.mp4")
+            assert disk_usage.call_count == 2
+
+    def test_batch_estimate_matches_scalar(self):
+        """Testa que a estimativa vetorizada coincide com a escalar"""
+        qualities = list(Quality)
+        resolutions = [(1280, 720), (1920, 1080), (3840, 2160), (640, 480)]
+
+        sizes = DiskSpaceValidator.estimate_video_size_batch(
+            [10, 60, 120, 5],
+            30,
+            [quality.bitrate for quality in qualities],
+            resolutions,
+        )
+
+        expected = [
+            DiskSpaceValidator.estimate_video_size(duration, 30, quality, resolution)
+            for duration, quality, resolution in zip([10, 60, 120, 5], qualities, resolutions)
+        ]
+        assert sizes.tolist() == pytest.approx(expected)
+
+
+class TestValidateCodec:
+    """Testes de validação de codec"""
+
+    def test_error_lists_first_codecs_alphabetically(self, configured_config):
+        """Testa que a mensagem de erro lista os primeiros codecs em ordem"""
+        codecs = frozenset(f"codec{i:02d}" for i in range(30))
+        configured_config._state = replace(
+            configured_config._state,
+            codec_cache=CodecQueryResult(codecs=codecs, using_fallback=False),
+        )
+
+        with pytest.raises(InvalidCodecError) as excinfo:
+            configured_config.validate_codec("inexistente")
+
+        expected = ", ".join(f"codec{i:02d}" for i in range(10))
+        assert str(excinfo.value).endswith(f"Codecs disponíveis: {expected}")
+
+    def test_validated_codec_is_remembered(self, configured_config):
+        """Testa que um codec confirmado não consulta a lista de novo"""
+        assert configured_config.validate_codec("libx264")
+
+        with patch.object(FFmpegConfig, "_get_available_codecs", side_effect=AssertionError):
+            assert configured_config.validate_codec("libx264")
+
+        configured_config.refresh_codec_cache()
+        assert configured_config._state.validated_codecs == frozenset()
+
+    def test_validated_codec_expires_with_cache(self, configured_config):
+        """Testa que a confirmação de um codec expira junto com a lista de codecs"""
+        assert configured_config.validate_codec("libx264")
+        state = configured_config._state
+        expired = replace(state.codec_cache, timestamp=time.monotonic() - CODEC_CACHE_TTL - 1)
+        configured_config._state = replace(state, codec_cache=expired)
+
+        codecs = CodecQueryResult(codecs=frozenset({"mpeg4"}), using_fallback=False)
+        with patch.object(
+            type(configured_config.validator), "query_available_codecs", return_value=codecs
+        ):
+            assert not configured_config.validate_codec("libx264", strict=False)
+        assert configured_config._state.validated_codecs == frozenset()
+
+
+class TestCreateWriter:
+    """Testes de criação de writer"""
+
+    def test_x264_uses_crf_and_fast_preset(self, configured_config):
+        """Testa que libx264 sem bitrate usa CRF e preset da qualidade"""
+        writer = configured_config.create_writer(quality="low")
+        assert writer.bitrate <= 0
+        assert writer.extra_args[:4] == ["-preset", "ultrafast", "-tune", "zerolatency"]
+        assert writer.extra_args[writer.extra_args.index("-crf") + 1] == "28"
+        assert "yuv420p" in writer.extra_args
+
+    def test_x264_enables_threading(self, configured_config):
+        """Testa que libx264 habilita encoding multi-thread"""
+        writer = configured_config.create_writer()
+        assert writer.extra_args[writer.extra_args.index("-threads") + 1] == "0"
+        assert "sliced-threads=1" in writer.extra_args[writer.extra_args.index("-x264-params") + 1]
+
+    def test_explicit_bitrate_disables_crf(self, configured_config):
+        """Testa que bitrate explícito desativa CRF"""
+        writer = configured_config.create_writer(bitrate=2000, preset="medium")
+        assert writer.bitrate == 2000
+        assert "-crf" not in writer.extra_args
+        assert writer.extra_args[:2] == ["-preset", "medium"]
+
+    def test_other_codecs_use_quality_bitrate(self, configured_config):
+        """Testa que codecs sem CRF usam bitrate do preset"""
+        writer = configured_config.create_writer(codec="mpeg4", quality="medium")
+        assert writer.bitrate == 3000
+        assert writer.extra_args == []
+
+    def test_default_metadata_is_shared_and_read_only(self, configured_config):
+        """Testa que os metadados padrão são compartilhados e imutáveis"""
+        first = configured_config.create_writer()
+        second = configured_config.create_writer()
+        assert first.metadata is second.metadata
+        assert first.metadata["artist"] == "Matplotlib Animation"
+        with pytest.raises(TypeError):
+            first.metadata["artist"] = "Outro"
+
+
+class TestHardwareEncoder:
+    """Testes de detecção de encoder de hardware"""
+
+    def test_auto_prefers_working_hw_encoder(self, configured_config):
+        """Testa que codec='auto' escolhe o primeiro encoder de hardware funcional"""
+        validator = configured_config.validator
+        with patch.object(
+            validator,
+            "query_available_encoders",
+            return_value={"libx264", "h264_nvenc", "h264_qsv"},
+        ), patch.object(validator, "probe_encoder", side_effect=lambda _, enc: enc == "h264_qsv"):
+            writer = configured_config.create_writer(codec="auto")
+
+        assert writer.codec == "h264_qsv"
+        assert writer.bitrate == 5000
+        assert "-crf" not in writer.extra_args
+
+    def test_auto_falls_back_to_libx264(self, configured_config):
+        """Testa fallback para libx264 sem encoder de hardware"""
+        validator = configured_config.validator
+        with patch.object(validator, "query_available_encoders", return_value={"libx264"}) as query:
+            assert configured_config.create_writer(codec="auto").codec == "libx264"
+            configured_config.create_writer(codec="auto")
+
+        # Resultado fica em cache
+        assert query.call_count == 1
 
 
 class TestSaveAnimation:
     """Testes de salvamento de animação"""
 
-    def test_save_animation_not_configured(self):
+    def test_save_animation_not_configured(self, unconfigured):
         """Testa que salvar sem configurar lança exceção"""
-        config = FFmpegConfig(auto_detect=False)
+        import matplotlib.pyplot as plt
+        from matplotlib.animation import FuncAnimation
 
         with pytest.raises(FFmpegNotConfiguredError):
             fig, ax = plt.subplots()
@@ -66,11 +543,167 @@ class TestSaveAnimation:
 
             ani = FuncAnimation(fig, update, frames=10)
             try:
-                config.save_animation(ani, "test.mp4")
+                unconfigured.save_animation(ani, "test.mp4")
             finally:
+                # Nunca renderizada: evita o aviso do Matplotlib ao coletá-la
+                ani._draw_was_started = True
                 plt.close(fig)
                 del ani
 
+    @pytest.mark.parametrize("cache_frame_data", [True, False])
+    def test_frame_cache_warning(self, caplog, cache_frame_data):
+        """Testa aviso de cache_frame_data com muitos frames"""
+        import matplotlib.pyplot as plt
+        from matplotlib.animation import FuncAnimation
+
+        fig, ax = plt.subplots()
+        (line,) = ax.plot([], [])
+        ani = FuncAnimation(
+            fig, lambda frame: (line,), frames=5000, cache_frame_data=cache_frame_data
+        )
+        try:
+            FFmpegConfig._warn_frame_cache(ani)
+        finally:
+            ani._draw_was_started = True  # Nunca renderizada (ver acima)
+            plt.close(fig)
+            del ani
+
+        assert ("cache_frame_data=True" in caplog.text) is cache_frame_data
+
+    def test_progress_logged_every_interval(self, unconfigured, caplog):
+        """Testa que o progresso é registrado a cada PROGRESS_LOG_INTERVAL frames"""
+        calls = []
+        with caplog.at_level(logging.INFO, logger="ffmpeg_matplotlib.config"):
+            callback = unconfigured._create_verbose_callback(
+                lambda current, total: calls.append(current)
+            )
+            for frame in range(3 * PROGRESS_LOG_INTERVAL):
+                callback(frame, 3 * PROGRESS_LOG_INTERVAL)
+
+        assert caplog.text.count("Progresso") == 3
+        assert len(calls) == 3 * PROGRESS_LOG_INTERVAL
+
+    def test_progress_callback_without_logging(self, unconfigured):
+        """Testa que, sem logging INFO, o callback do usuário é usado direto"""
+
+        def user_callback(current, total):
+            pass
+
+        logger = logging.getLogger("ffmpeg_matplotlib.config")
+        with patch.object(logger, "isEnabledFor", return_value=False):
+            callback = unconfigured._create_verbose_callback(user_callback)
+
+        assert callback is user_callback
+
+    def test_verbose_requires_info_level(self):
+        """Testa que verbose é ignorado quando o logger não emite INFO"""
+        options = SaveOptions(verbose=True)
+        logger = logging.getLogger("ffmpeg_matplotlib.config")
+
+        with patch.object(logger, "isEnabledFor", return_value=False):
+            assert not FFmpegConfig._verbose(options)
+        assert not FFmpegConfig._verbose(SaveOptions(verbose=False))
+
+    def test_count_frames_uses_save_count(self, simple_animation):
+        """Testa que o total de frames vem da própria animação"""
+        assert FFmpegConfig._count_frames(simple_animation) == 10
+
+    def test_batch_reuses_writer(self, configured_config, simple_animation, temp_dir):
+        """Testa que o salvamento em lote cria um único writer"""
+        writers = []
+
+        def fake_save(animation, filename, writer=None, **kwargs):
+            writers.append(writer)
+            with open(filename, "wb") as file:
+                file.write(b"\x00")
+
+        with patch.object(type(simple_animation), "save", fake_save), patch.object(
+            FFmpegConfig, "create_writer", wraps=configured_config.create_writer
+        ) as create_writer:
+            saved = configured_config.save_animations_batch(
+                [
+                    (simple_animation, str(temp_dir / "a")),
+                    (simple_animation, str(temp_dir / "b.mp4")),
+                ],
+                verbose=False,
+            )
+
+        assert saved == [str(temp_dir / "a.mp4"), str(temp_dir / "b.mp4")]
+        assert create_writer.call_count == 1
+        assert writers[0] is writers[1]
+
+    def test_batch_writer_per_container(self, configured_config, simple_animation, temp_dir):
+        """Testa que .webm não reaproveita o writer (nem os argumentos) do .mp4"""
+        writers = []
+
+        def fake_save(animation, filename, writer=None, **kwargs):
+            writers.append(writer)
+            # Como no Matplotlib: output_args troca o codec para .webm
+            writer.outfile = filename
+            assert writer.output_args
+            with open(filename, "wb") as file:
+                file.write(b"\x00")
+
+        with patch.object(type(simple_animation), "save", fake_save):
+            configured_config.save_animations_batch(
+                [
+                    (simple_animation, str(temp_dir / "a.mp4")),
+                    (simple_animation, str(temp_dir / "b.webm")),
+                    (simple_animation, str(temp_dir / "c.mp4")),
+                ],
+                verbose=False,
+            )
+
+        assert [writer.codec for writer in writers] == ["libx264", "webm", "libx264"]
+        assert writers[0] is writers[2]
+        assert "-crf" not in writers[1].extra_args
+
+    @pytest.mark.parametrize("filename", ["c.webm", "c.gif"])
+    def test_real_encode_container_codec(self, real_config, simple_animation, temp_dir, filename):
+        """Testa salvamentos reais cujo codec vem do container"""
+        options = SaveOptions(quality="low", dpi=40, verbose=False)
+        saved = real_config.save_animation(
+            simple_animation, str(temp_dir / filename), options=options
+        )
+        batch = real_config.save_animations_batch(
+            [(simple_animation, str(temp_dir / ("lote-" + filename)))], options=options
+        )
+
+        for path in [saved] + batch:
+            assert path.endswith(filename)
+            assert os.path.getsize(path) > 0
+
+    @pytest.mark.parametrize("total_frames, checks", [(10, False), (600, True)])
+    def test_short_video_skips_disk_check(self, configured_config, temp_dir, total_frames, checks):
+        """Testa que vídeos curtos não consultam o espaço em disco"""
+        options = SaveOptions(verbose=False)
+        with patch.object(DiskSpaceValidator, "check_space") as check_space:
+            configured_config._prepare_save(
+                str(temp_dir / "video.mp4"), options, None, total_frames
+            )
+        assert check_space.called is checks
+
+    @pytest.mark.parametrize(
+        "filename, expected",
+        [("video.mkv", "video.mkv"), ("video.v2", "video.v2.mp4"), ("a.gif", "a.gif")],
+    )
+    def test_output_extension(self, configured_config, temp_dir, filename, expected):
+        """Testa que extensões não suportadas recebem .mp4"""
+        options = SaveOptions(verbose=False)
+        file_path, _, _ = configured_config._prepare_save(
+            str(temp_dir / filename), options, None, 0
+        )
+        assert file_path == str(temp_dir / expected)
+
+    @pytest.mark.parametrize(
+        "resolution, fps, warns",
+        [((1280, 720), 30, False), ((3840, 2160), 60, True)],
+    )
+    def test_pipe_throughput_warning(self, caplog, resolution, fps, warns):
+        """Testa aviso de volume alto de frames enviados ao FFmpeg"""
+        FFmpegConfig._warn_pipe_throughput(resolution, fps)
+        assert ("MB/s" in caplog.text) is warns
+
 
 class TestConvenienceFunctions:
     """Testes de funções de conveniência"""
@@ -79,10 +712,71 @@ class TestConvenienceFunctions:
         """Testa que função configurar_ffmpeg existe"""
         assert callable(configurar_ffmpeg)
 
-    def test_configurar_ffmpeg_returns_bool(self):
+    def test_configurar_ffmpeg_returns_bool(self, configurar_ffmpeg_result):
         """Testa que configurar_ffmpeg retorna bool"""
-        result = configurar_ffmpeg()
-        assert isinstance(result, bool)
+        assert isinstance(configurar_ffmpeg_result, bool)
+
+    def test_configurar_ffmpeg_keeps_warm_up(self, shared_mock_ffmpeg_path):
+        """Testa que a consulta de fundo não é descartada nem serializada"""
+        validation = ValidationResult(
+            is_valid=True, path=shared_mock_ffmpeg_path, version=(6, 1, 0)
+        )
+        codecs = CodecQueryResult(codecs=frozenset({"libx264"}), using_fallback=False)
+
+        started = threading.Event()
+        release = threading.Event()
+        probes = []
+
+        def slow_query(path):
+            started.set()
+            # Só é liberada se configurar_ffmpeg() retornar sem esperar a consulta
+            probes.append((threading.current_thread(), release.wait(5)))
+            return validation, codecs
+
+        FFmpegConfigSingleton.reset_instance()
+        try:
+            with patch.object(
+                FFmpegDetector, "auto_detect", return_value=shared_mock_ffmpeg_path
+            ), patch.object(FFmpegValidator, "validate_and_query", side_effect=slow_query) as query:
+                assert configurar_ffmpeg()
+                assert started.wait(5)
+                assert configurar_ffmpeg()
+
+                config = obter_config_global()
+                warm_up = config._warm_up_thread
+                release.set()
+                warm_up.join(5)
+
+                assert probes == [(warm_up, True)]
+                assert warm_up is not threading.main_thread()
+                assert config.version == (6, 1, 0)
+                assert config.get_available_codecs() == {"libx264"}
+                assert query.call_count == 1
+        finally:
+            FFmpegConfigSingleton.reset_instance()
+
+    def test_global_config_is_singleton(self):
+        """Testa que a configuração global é reaproveitada até o reset"""
+        FFmpegConfigSingleton.reset_instance()
+        try:
+            first = obter_config_global()
+            assert obter_config_global() is first
+            assert FFmpegConfigSingleton.get_instance(strict_mode=True) is first
+
+            FFmpegConfigSingleton.reset_instance()
+            assert obter_config_global() is not first
+        finally:
+            FFmpegConfigSingleton.reset_instance()
+
+    def test_otimizar_matplotlib_para_animacao(self):
+        """Testa que rcParams de simplificação são aplicados"""
+        import matplotlib
+
+        with matplotlib.rc_context():
+            otimizar_matplotlib_para_animacao()
+            assert matplotlib.rcParams["path.simplify"] is True
+            assert matplotlib.rcParams["path.simplify_threshold"] == 1.0
+            assert matplotlib.rcParams["agg.path.chunksize"] == 10000
 
 
 class TestVersion:
@@ -103,8 +797,28 @@ class TestVersion:
 
 
 # Teste simples para rodar primeiro
-def test_import_works():
-    """Testa que o pacote pode ser importado"""
-    import ffmpeg_matplotlib
+@pytest.mark.parametrize(
+    "module_name, attribute",
+    [
+        ("ffmpeg_matplotlib", "__version__"),
+        ("ffmpeg_matplotlib", "configurar_ffmpeg"),
+        ("ffmpeg_matplotlib", "salvar_animacao"),
+        ("ffmpeg_matplotlib", "criar_writer"),
+        ("ffmpeg_matplotlib", "otimizar_matplotlib_para_animacao"),
+        ("ffmpeg_matplotlib.config", "FFmpegConfig"),
+    ],
+)
+def test_import_works(module_name, attribute):
+    """Testa que o pacote pode ser importado e expõe a API pública"""
+    module = importlib.import_module(module_name)
+    assert hasattr(module, attribute)
+
 
-    assert ffmpeg_matplotlib is not None
+def test_import_does_not_load_matplotlib():
+    """Testa que importar o pacote não carrega o Matplotlib (importação rápida)"""
+    code = (
+        "import sys, ffmpeg_matplotlib; "
+        "sys.exit('matplotlib' in sys.modules or 'numpy' in sys.modules)"
+    )
+    result = subprocess.run([sys.executable, "-c", code], check=False)
+    assert result.returncode == 0
@@ -2,60 +2,186 @@
 Testes para FFmpegDetector
 """
 
-from unittest.mock import patch
+import os
+import sys
+from pathlib import Path
+from unittest.mock import Mock
 
+import pytest
+
+from ffmpeg_matplotlib import config
 from ffmpeg_matplotlib.config import FFmpegDetector
 
 
+@pytest.fixture(
+    params=[
+        pytest.param(
+            "", marks=pytest.mark.skipif(sys.platform == "win32", reason="Sem bit de execução")
+        ),
+        ".EXE",
+    ]
+)
+def exe_suffix(request, monkeypatch):
+    """Sufixo dos executáveis fake: "" (bit de execução) ou via PATHEXT"""
+    monkeypatch.setattr(config, "_PATH_EXTENSIONS", (request.param,))
+    return request.param
+
+
+@pytest.fixture
+def ffmpeg_in_path(tmp_path, exe_suffix, monkeypatch):
+    """Cria FFmpeg fake executável em um diretório colocado no PATH"""
+    ffmpeg = tmp_path / "bin" / ("ffmpeg" + exe_suffix)
+    ffmpeg.parent.mkdir()
+    ffmpeg.touch(mode=0o755)
+    monkeypatch.setenv("PATH", str(ffmpeg.parent))
+    return str(ffmpeg)
+
+
+@pytest.fixture
+def find_in_path(monkeypatch):
+    """Substitui FFmpegDetector.find_in_path por um mock (padrão: encontrado)"""
+    mock = Mock(return_value="/usr/bin/ffmpeg")
+    monkeypatch.setattr(FFmpegDetector, "find_in_path", mock)
+    return mock
+
+
+class TestSystemPaths:
+    """Testes de caminhos específicos do SO"""
+
+    def test_system_paths_are_computed_once(self):
+        """Testa que os caminhos são a mesma tupla em todas as chamadas"""
+        first = FFmpegDetector.get_system_specific_paths()
+        assert isinstance(first, tuple)
+        assert first is FFmpegDetector.get_system_specific_paths()
+
+
 class TestResolveP:
     """Testes de resolução de caminho"""
 
-    def test_resolve_path_with_which(self):
-        """Testa resolução usando shutil.which"""
-        with patch("shutil.which", return_value="/usr/bin/ffmpeg"):
-            result = FFmpegDetector.resolve_path("ffmpeg")
-            assert result == "/usr/bin/ffmpeg"
+    def test_resolve_path_in_path(self, ffmpeg_in_path):
+        """Testa resolução de nome de comando pelo PATH"""
+        assert FFmpegDetector.resolve_path("ffmpeg") == ffmpeg_in_path
 
-    def test_resolve_path_not_found(self):
+    def test_resolve_path_not_found(self, tmp_path, monkeypatch):
         """Testa quando caminho não é encontrado"""
-        with patch("shutil.which", return_value=None):
-            with patch("pathlib.Path.exists", return_value=False):
-                result = FFmpegDetector.resolve_path("/nonexistent/ffmpeg")
-                assert result is None
+        monkeypatch.setenv("PATH", str(tmp_path))
+        assert FFmpegDetector.resolve_path(str(tmp_path / "ausente" / "ffmpeg")) is None
+
+    def test_resolve_absolute_file_as_is(self, tmp_path, monkeypatch):
+        """Testa que caminho absoluto existente é retornado sem resolve()"""
+        monkeypatch.setenv("PATH", str(tmp_path))
+        ffmpeg = tmp_path / "ffmpeg"
+        ffmpeg.touch()
+        resolve = Mock()
+        monkeypatch.setattr(Path, "resolve", resolve)
+        assert FFmpegDetector.resolve_path(str(ffmpeg)) == str(ffmpeg)
+        resolve.assert_not_called()
 
 
 class TestFindInPath:
     """Testes de busca no PATH"""
 
-    def test_find_in_path_success(self):
+    def test_find_in_path_success(self, ffmpeg_in_path):
         """Testa busca bem-sucedida no PATH"""
-        with patch("shutil.which", return_value="/usr/bin/ffmpeg"):
-            result = FFmpegDetector.find_in_path()
-            assert result == "/usr/bin/ffmpeg"
+        assert FFmpegDetector.find_in_path() == ffmpeg_in_path
 
-    def test_find_in_path_not_found(self):
+    def test_find_in_path_not_found(self, tmp_path, monkeypatch):
         """Testa busca sem sucesso no PATH"""
-        with patch("shutil.which", return_value=None):
-            result = FFmpegDetector.find_in_path()
-            assert result is None
+        monkeypatch.setenv("PATH", str(tmp_path))
+        assert FFmpegDetector.find_in_path() is None
+
+    def test_find_in_path_skips_non_executable(self, tmp_path, exe_suffix, monkeypatch):
+        """Testa que entradas do PATH sem executável válido são ignoradas"""
+        # Sem bit de execução nem extensão do PATHEXT
+        (tmp_path / "a").mkdir()
+        (tmp_path / "a" / "ffmpeg").touch(mode=0o644)
+        (tmp_path / "b" / ("ffmpeg" + exe_suffix)).mkdir(parents=True)
+        executable = tmp_path / "c" / ("ffmpeg" + exe_suffix)
+        executable.parent.mkdir()
+        executable.touch(mode=0o755)
+        directories = ("", "a", "b", "c")
+        monkeypatch.setenv("PATH", os.pathsep.join(str(tmp_path / name) for name in directories))
+
+        assert FFmpegDetector.find_in_path() == str(executable)
+
+    def test_windows_extensions(self, tmp_path, monkeypatch):
+        """Testa PATHEXT: nome sem extensão ganha sufixo, com extensão fica como está"""
+        monkeypatch.setattr(config, "_PATH_EXTENSIONS", (".COM", ".EXE"))
+        monkeypatch.setenv("PATH", str(tmp_path))
+        for name in ("ffmpeg.exe", "ffprobe.EXE"):
+            (tmp_path / name).touch(mode=0o755)
+
+        assert FFmpegDetector.resolve_path("ffmpeg.exe") == str(tmp_path / "ffmpeg.exe")
+        assert FFmpegDetector.resolve_path("ffprobe") == str(tmp_path / "ffprobe.EXE")
+
+    def test_find_in_path_is_cached_per_path(self, ffmpeg_in_path, monkeypatch):
+        """Testa que o PATH é percorrido uma vez por valor de PATH"""
+        directory = os.path.dirname(ffmpeg_in_path)
+        which = Mock(wraps=config._which)
+        monkeypatch.setattr(config, "_which", which)
+
+        FFmpegDetector.find_in_path()
+        FFmpegDetector.find_in_path()
+        assert which.call_count == 1
+
+        monkeypatch.setenv("PATH", directory + os.pathsep + "/outro/bin")
+        FFmpegDetector.find_in_path()
+        assert which.call_count == 2
+
+        FFmpegDetector.invalidate()
+        assert FFmpegDetector.find_in_path() == ffmpeg_in_path
+        assert which.call_count == 3
 
 
 class TestAutoDetect:
     """Testes de auto-detecção"""
 
-    def test_auto_detect_finds_in_path(self):
+    def test_auto_detect_finds_in_path(self, find_in_path):
         """Testa detecção via PATH"""
-        with patch.object(
-            FFmpegDetector, "find_in_path", return_value="/usr/bin/ffmpeg"
-        ):
-            result = FFmpegDetector.auto_detect()
-            assert result == "/usr/bin/ffmpeg"
+        assert FFmpegDetector.auto_detect() == "/usr/bin/ffmpeg"
 
-    def test_auto_detect_not_found(self):
+    def test_auto_detect_not_found(self, find_in_path, monkeypatch):
         """Testa quando não encontra FFmpeg"""
-        with patch.object(FFmpegDetector, "find_in_path", return_value=None):
-            with patch.object(
-                FFmpegDetector, "get_system_specific_paths", return_value=[]
-            ):
-                result = FFmpegDetector.auto_detect()
-                assert result is None
+        find_in_path.return_value = None
+        monkeypatch.setattr(config, "_SYSTEM_FFMPEG_PATHS", ())
+        assert FFmpegDetector.auto_detect() is None
+
+    def test_auto_detect_skips_non_executable(
+        self, tmp_path, exe_suffix, find_in_path, monkeypatch
+    ):
+        """Testa que diretórios e arquivos sem permissão de execução são ignorados"""
+        not_executable = tmp_path / "a" / "ffmpeg"
+        executable = tmp_path / "b" / ("ffmpeg" + exe_suffix)
+        for path, mode in ((not_executable, 0o644), (executable, 0o755)):
+            path.parent.mkdir()
+            path.touch()
+            path.chmod(mode)
+        directory = tmp_path / "c" / "ffmpeg"
+        directory.mkdir(parents=True)
+        candidates = (
+            str(tmp_path / "ausente"),
+            str(not_executable),
+            str(directory),
+            str(executable),
+        )
+
+        find_in_path.return_value = None
+        monkeypatch.setattr(config, "_SYSTEM_FFMPEG_PATHS", candidates)
+
+        assert FFmpegDetector.auto_detect() == str(executable)
+
+    def test_auto_detect_is_cached(self, find_in_path):
+        """Testa que a busca roda uma única vez para o mesmo PATH"""
+        FFmpegDetector.auto_detect()
+        assert FFmpegDetector.auto_detect() == "/usr/bin/ffmpeg"
+        assert find_in_path.call_count == 1
+
+    def test_auto_detect_cache_invalidation(self, find_in_path, monkeypatch):
+        """Testa que invalidate() e mudanças no PATH forçam nova busca"""
+        FFmpegDetector.auto_detect()
+        FFmpegDetector.invalidate()
+        FFmpegDetector.auto_detect()
+        monkeypatch.setenv("PATH", "/outro/bin")
+        FFmpegDetector.auto_detect()
+
+        assert find_in_path.call_count == 3
@@ -0,0 +1,125 @@
+"""
+Testes para BufferedFFMpegWriter
+"""
+
+import io
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import matplotlib.pyplot as plt
+import pytest
+
+from ffmpeg_matplotlib.writer import BufferedFFMpegWriter, render_frames_parallel
+
+
+@pytest.fixture
+def figure():
+    """Cria figura simples para testes"""
+    fig, ax = plt.subplots(figsize=(6.4, 4.8))
+    ax.plot([0, 1], [0, 1])
+    yield fig
+    plt.close(fig)
+
+
+def small_figure():
+    """Cria figura pequena (piclável, para os workers)"""
+    fig, ax = plt.subplots(figsize=(1, 1))
+    ax.set_ylim(0, 10)
+    ax.plot([0, 1], [0, 0])
+    return fig
+
+
+def move_line(fig, frame):
+    """Posiciona a linha conforme o frame"""
+    fig.axes[0].lines[0].set_ydata([frame, frame])
+
+
+def make_writer(fig, dpi):
+    """Cria writer pronto para grab_frame, com pipe substituído por BytesIO"""
+    writer = BufferedFFMpegWriter(fps=10)
+    writer.fig = fig
+    writer.dpi = dpi
+    writer._w, writer._h = fig.get_size_inches()
+    writer.bytes_sent = 0
+    writer._original_dpi = None
+    writer._fast_path = True
+    writer._proc = SimpleNamespace(stdin=io.BytesIO())
+    return writer
+
+
+class TestGrabFrame:
+    """Testes de captura de frames"""
+
+    @pytest.mark.parametrize("dpi", [72, 150])
+    def test_fast_path_matches_savefig(self, figure, dpi):
+        """Testa que o buffer RGBA enviado é idêntico ao do savefig"""
+        expected = io.BytesIO()
+        figure.savefig(expected, format="rgba", dpi=dpi)
+
+        writer = make_writer(figure, dpi)
+        # Como dentro de Animation.save, que marca o canvas como salvando
+        with patch.object(figure.canvas, "is_saving", return_value=True), patch.object(
+            writer, "_grab_frame_savefig", side_effect=AssertionError
+        ):
+            writer.grab_frame()
+
+        assert writer._proc.stdin.getvalue() == expected.getvalue()
+        assert writer.bytes_sent == len(expected.getvalue())
+
+    def test_fast_path_draws_animated_artists(self, figure):
+        """Testa que artistas animated=True aparecem fora de Animation.save"""
+        figure.axes[0].plot([0, 1], [1, 0], color="red", animated=True)
+        expected = io.BytesIO()
+        figure.savefig(expected, format="rgba", dpi=72)
+
+        writer = make_writer(figure, 72)
+        writer.grab_frame()
+
+        assert writer._proc.stdin.getvalue() == expected.getvalue()
+
+    def test_savefig_kwargs_use_default_path(self, figure):
+        """Testa que kwargs de savefig desativam o caminho rápido"""
+        writer = make_writer(figure, 72)
+        figure.canvas.draw()
+        writer.grab_frame(facecolor="black")
+
+        width, height = writer.frame_size
+        assert len(writer._proc.stdin.getvalue()) == width * height * 4
+        assert writer.bytes_sent == width * height * 4
+
+    def test_grab_frame_raw(self, figure):
+        """Testa envio de frame já renderizado"""
+        writer = make_writer(figure, 72)
+        width, height = writer.frame_size
+        frame = bytes(width * height * 4)
+
+        writer.grab_frame_raw(frame)
+
+        assert writer._proc.stdin.getvalue() == frame
+        assert writer.bytes_sent == len(frame)
+
+    def test_grab_frame_raw_rejects_wrong_size(self, figure):
+        """Testa que frame com tamanho errado é rejeitado"""
+        writer = make_writer(figure, 72)
+
+        with pytest.raises(ValueError):
+            writer.grab_frame_raw(b"\x00" * 16)
+
+
+class TestRenderFramesParallel:
+    """Testes de renderização paralela"""
+
+    def test_frames_in_order(self):
+        """Testa que frames chegam em ordem e iguais à renderização serial"""
+        fig = small_figure()
+        expected = []
+        for frame in range(5):
+            move_line(fig, frame)
+            buffer = io.BytesIO()
+            fig.savefig(buffer, format="rgba", dpi=50)
+            expected.append(buffer.getvalue())
+        plt.close(fig)
+
+        frames = list(render_frames_parallel(small_figure, move_line, 5, dpi=50, workers=2))
+
+        assert frames == expected